@@ -0,0 +1,107 @@
+class Car:
+    __slots__ = ("_car_id", "_brand", "_model", "_purchase_price", "_rental_price_per_day")
+
+    @staticmethod
+    def validate_car_id(value):
+        if not isinstance(value, str) or not value.strip():
+            raise ValueError("car_id должен быть непустой строкой")
+
+    @staticmethod
+    def validate_text(value):
+        if not isinstance(value, str) or not value.strip():
+            raise ValueError("Марка/Модель должны быть непустой строкой")
+
+    @staticmethod
+    def validate_price(value):
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+            raise ValueError("Цена должна быть неотрицательным числом")
+
+    def __init__(self, *args):
+        if len(args) == 1:
+            arg = args[0]
+            if isinstance(arg, dict):
+                car_id = arg.get("car_id", "")
+                brand = arg.get("brand", "")
+                model = arg.get("model", "")
+                purchase_price = arg.get("purchase_price")
+                rental_price_per_day = arg.get("rental_price_per_day")
+            else:
+                raise ValueError("Неверный тип аргумента для перегрузки")
+        elif len(args) == 5:
+            car_id, brand, model, purchase_price, rental_price_per_day = args
+        else:
+            raise ValueError("Неверное количество аргументов для Car")
+
+        self.validate_car_id(car_id)
+        self.validate_text(brand)
+        self.validate_text(model)
+        self.validate_price(purchase_price)
+        self.validate_price(rental_price_per_day)
+        self._car_id = car_id
+        self._brand = brand
+        self._model = model
+        self._purchase_price = float(purchase_price)
+        self._rental_price_per_day = float(rental_price_per_day)
+
+    def calculate_rental_cost(self, days):
+        if isinstance(days, bool) or not isinstance(days, int) or days < 0:
+            raise ValueError("Количество дней должно быть неотрицательным целым числом")
+        return days * self._rental_price_per_day
+
+    def __str__(self):
+        return (f"Car(car_id={self._car_id}, brand={self._brand}, model={self._model}, "
+                f"purchase_price={self._purchase_price}, rental_price_per_day={self._rental_price_per_day})")
+
+    def __eq__(self, other):
+        if not isinstance(other, Car):
+            return False
+        return (self._car_id == other._car_id and
+                self._brand == other._brand and
+                self._model == other._model and
+                self._purchase_price == other._purchase_price and
+                self._rental_price_per_day == other._rental_price_per_day)
+
+    @property
+    def car_id(self):
+        return self._car_id
+
+    @car_id.setter
+    def car_id(self, value):
+        self.validate_car_id(value)
+        self._car_id = value
+
+    @property
+    def brand(self):
+        return self._brand
+
+    @brand.setter
+    def brand(self, value):
+        self.validate_text(value)
+        self._brand = value
+
+    @property
+    def model(self):
+        return self._model
+
+    @model.setter
+    def model(self, value):
+        self.validate_text(value)
+        self._model = value
+
+    @property
+    def purchase_price(self):
+        return self._purchase_price
+
+    @purchase_price.setter
+    def purchase_price(self, value):
+        self.validate_price(value)
+        self._purchase_price = float(value)
+
+    @property
+    def rental_price_per_day(self):
+        return self._rental_price_per_day
+
+    @rental_price_per_day.setter
+    def rental_price_per_day(self, value):
+        self.validate_price(value)
+        self._rental_price_per_day = float(value)
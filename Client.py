@@ -1,7 +1,90 @@
+import asyncio
+import fnmatch
 import json
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Форматы файлов для потоковой загрузки и соответствующие методы разбора строки
+_FILE_PARSERS = {
+    "csv": "from_string",
+    "jsonl": "from_json",
+}
+
+# Ошибки, которые считаются ошибкой одной записи, а не всей загрузки
+# (AttributeError/TypeError - JSON-значение не объект или поле не строка)
+_ROW_ERRORS = (ValueError, TypeError, AttributeError)
+
+_DIGITS_RE = re.compile(r"(\d+)")
+
+# Слоты, которые не переносятся в копию и при pickle: подписки принадлежат
+# исходному объекту, а отметки изменений относятся к его истории
+_TRANSIENT_SLOTS = ("_listeners", "_dirty")
+
+
+@lru_cache(maxsize=None)
+def _state_slots(cls):
+    return tuple(name for klass in cls.__mro__ for name in getattr(klass, "__slots__", ())
+                 if name not in _TRANSIENT_SLOTS)
+
+
+def _dumps(data):
+    # Сериализация в JSON без экранирования кириллицы (как в Client.txt); orjson - если установлен
+    if orjson is not None:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+class ClientLoadError(ValueError):
+    # Ошибка загрузки набора файлов: errors - список пар (путь к файлу, исключение)
+    def __init__(self, errors):
+        self.errors = list(errors)
+        details = "; ".join(f"{path}: {error}" for path, error in self.errors[:5])
+        more = f" и еще {len(self.errors) - 5}" if len(self.errors) > 5 else ""
+        super().__init__(f"Не удалось загрузить файлов: {len(self.errors)} ({details}{more})")
+
+
+def _batch_parser_name(format):
+    if format is None:
+        return None
+    if format not in _FILE_PARSERS:
+        raise ValueError(f"Неизвестный формат: {format}")
+    return _FILE_PARSERS[format]
+
+
+def _collect_chunk(results, numbers, future):
+    # Результаты куска файла с номерами строк: (номер_строки, объект, ошибка)
+    results.extend((line_no, obj, error) for line_no, (obj, error) in zip(numbers, future.result()))
+
+
+def _parse_chunk(cls, parser_name, rows):
+    # Выполняется в дочернем процессе: разбор и валидация пачки строк
+    parse = cls if parser_name is None else getattr(cls, parser_name)
+    results = []
+    for row in rows:
+        try:
+            results.append((parse(row), None))
+        except _ROW_ERRORS as e:
+            results.append((None, e))
+    return results
 
 
 class ClientShort:
+    # Без __dict__ у каждого экземпляра: заметно экономит память на больших наборах клиентов
+    # _dirty - None (изменений нет) или dict: поле -> значение до первого изменения
+    __slots__ = ("_client_id", "_last_name", "_initials", "_phone", "_listeners", "_dirty")
+
+    # Порядок полей в строке через ';' и ключи JSON
+    _FIELDS = ("client_id", "last_name", "initials", "phone")
+
     @staticmethod
     def validate_client_id(value):
         if not isinstance(value, str) or not value.strip():
@@ -22,27 +105,26 @@ class ClientShort:
         if not isinstance(value, str) or not value.strip():
             raise ValueError("Телефон должен быть непустой строкой")
 
-    def __init__(self, *args):
+    @staticmethod
+    def natural_key(client_id):
+        # Ключ естественной сортировки: числовые части сравниваются как числа
+        # ("99" < "101", "A2" < "A10"); строки и числа в ключе всегда чередуются
+        parts = _DIGITS_RE.split(client_id)
+        parts[1::2] = map(int, parts[1::2])
+        return tuple(parts)
+
+    @staticmethod
+    def normalize_phone(value):
+        # Оставляем только цифры: "+7-123-456-78-90" -> "71234567890"
+        return "".join(ch for ch in value if ch.isdigit())
+
+    def __init__(self, *args, format=None):
         if len(args) == 1:
             arg = args[0]
             if isinstance(arg, str):
-                # Попытка парсинга как JSON
-                try:
-                    data = json.loads(arg)
-                    client_id = data.get("client_id", "")
-                    last_name = data.get("last_name", "")
-                    initials = data.get("initials", "")
-                    phone = data.get("phone", "")
-                except json.JSONDecodeError:
-                    # Парсинг как строка: client_id;last_name;initials;phone
-                    parts = arg.split(';')
-                    if len(parts) != 4:
-                        raise ValueError("Неверный формат строки или JSON")
-                    client_id = parts[0].strip()
-                    last_name = parts[1].strip()
-                    initials = parts[2].strip()
-                    phone = parts[3].strip()
-            elif isinstance(arg, dict):
+                # Строка: JSON или client_id;last_name;initials;phone
+                arg = self._parse_str(arg, format)
+            if isinstance(arg, dict):
                 # Прямая передача dict (JSON-like)
                 client_id = arg.get("client_id", "")
                 last_name = arg.get("last_name", "")
@@ -64,27 +146,54 @@ class ClientShort:
         self._last_name = last_name
         self._initials = initials
         self._phone = phone
+        self._listeners = ()
+        self._dirty = None
+
+    @staticmethod
+    def _sniff_format(s):
+        # '{' в начале строки - JSON, иначе строка через ';'.
+        # Так строки через ';' не проходят через заведомо неудачный json.loads.
+        return "json" if s.lstrip()[:1] == "{" else "csv"
+
+    @classmethod
+    def _parse_str(cls, s, format=None):
+        # Разбор строки-аргумента конструктора в dict с полями cls._FIELDS
+        if format is None:
+            format = cls._sniff_format(s)
+        if format == "csv":
+            return dict(zip(cls._FIELDS, cls._parse_row(s, "Неверный формат строки или JSON")))
+        if format == "json":
+            try:
+                data = json.loads(s)
+            except json.JSONDecodeError:
+                raise ValueError("Неверный формат строки или JSON")
+            if not isinstance(data, dict):
+                raise ValueError("Неверный формат строки или JSON")
+            return data
+        raise ValueError(f"Неизвестный формат: {format}")
+
+    @classmethod
+    def _parse_row(cls, s, error="Неверный формат строки"):
+        # Строка с полями cls._FIELDS через ';'
+        parts = s.split(';')
+        if len(parts) != len(cls._FIELDS):
+            raise ValueError(error)
+        return tuple(map(str.strip, parts))
+
+    @classmethod
+    def _values_from_dict(cls, data):
+        return [data.get(name, "") for name in cls._FIELDS]
 
     @classmethod
     def from_string(cls, s):
         # Парсинг строки в формате: client_id;last_name;initials;phone
-        parts = s.split(';')
-        if len(parts) != 4:
-            raise ValueError("Неверный формат строки")
-        client_id = parts[0].strip()
-        last_name = parts[1].strip()
-        initials = parts[2].strip()
-        phone = parts[3].strip()
-        return cls(client_id, last_name, initials, phone)
+        # (для Client: client_id;last_name;first_name;middle_name;address;phone)
+        return cls(*cls._parse_row(s))
 
     @classmethod
     def from_json(cls, json_str):
         data = json.loads(json_str)
-        client_id = data.get("client_id", "")
-        last_name = data.get("last_name", "")
-        initials = data.get("initials", "")
-        phone = data.get("phone", "")
-        return cls(client_id, last_name, initials, phone)
+        return cls(*cls._values_from_dict(data))
 
     @classmethod
     def from_json_file(cls, file_path):
@@ -97,6 +206,192 @@ class ClientShort:
         except json.JSONDecodeError:
             raise ValueError(f"Неверный JSON в файле {file_path}")
 
+    @classmethod
+    def iter_from_file(cls, file_path, format="csv"):
+        # Потоковое чтение большого файла: одна запись на строку.
+        # format="csv" - строки через ';' (как в from_string),
+        # format="jsonl" - по одному JSON-объекту на строку (как в from_json).
+        # Генератор отдает кортежи (номер_строки, объект, ошибка): при ошибке
+        # в строке объект равен None, и загрузка продолжается со следующей строки.
+        if format not in _FILE_PARSERS:
+            raise ValueError(f"Неизвестный формат файла: {format}")
+        parse = getattr(cls, _FILE_PARSERS[format])
+        try:
+            f = open(file_path, 'r', encoding='utf-8')
+        except FileNotFoundError:
+            raise ValueError(f"Файл {file_path} не найден")
+        with f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield line_no, parse(line), None
+                except _ROW_ERRORS as e:
+                    yield line_no, None, e
+
+    @classmethod
+    async def aload_dir(cls, dir_path, concurrency=8, pattern="*", errors=None):
+        # Асинхронная загрузка каталога JSON-файлов (по клиенту на файл, как Client.txt).
+        # Файлы читаются и разбираются через from_json_file в пуле потоков; одновременно
+        # в работе не больше concurrency файлов, а новые берутся по мере того, как
+        # вызывающий код забирает готовых клиентов (async for).
+        # Клиенты отдаются в порядке готовности. Ошибки (нечитаемый файл, неверный JSON,
+        # неверные поля) собираются парами (путь, ошибка) в список errors; если он не
+        # передан, после обработки всех файлов выбрасывается ClientLoadError.
+        if concurrency < 1:
+            raise ValueError("concurrency должен быть положительным числом")
+        if not os.path.isdir(dir_path):
+            raise ValueError(f"Каталог {dir_path} не найден")
+        failures = [] if errors is None else errors
+        paths = (entry.path for entry in os.scandir(dir_path)
+                 if entry.is_file() and fnmatch.fnmatch(entry.name, pattern))
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        in_flight = {}
+
+        def fill():
+            while len(in_flight) < concurrency:
+                path = next(paths, None)
+                if path is None:
+                    return
+                in_flight[loop.run_in_executor(executor, cls.from_json_file, path)] = path
+
+        try:
+            fill()
+            while in_flight:
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                ready = []
+                for future in done:
+                    path = in_flight.pop(future)
+                    try:
+                        ready.append(future.result())
+                    except (OSError,) + _ROW_ERRORS as e:
+                        failures.append((path, e))
+                fill()
+                for client in ready:
+                    yield client
+        finally:
+            for future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+        if errors is None and failures:
+            raise ClientLoadError(failures)
+
+    @classmethod
+    def parse_batch(cls, rows, format=None, workers=None, chunk_size=1000):
+        # Параллельный разбор списка сырых строк в нескольких процессах.
+        # format=None - как в конструкторе (JSON или строка через ';'),
+        # "csv"/"jsonl" - через from_string/from_json.
+        # Возвращает список пар (объект, ошибка) в порядке входных строк.
+        parser_name = _batch_parser_name(format)
+        if chunk_size < 1:
+            raise ValueError("chunk_size должен быть положительным числом")
+        rows = list(rows)
+        chunks = [rows[i:i + chunk_size] for i in range(0, len(rows), chunk_size)]
+        results = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk_result in executor.map(_parse_chunk, repeat(cls), repeat(parser_name), chunks):
+                results.extend(chunk_result)
+        return results
+
+    @classmethod
+    def parse_file_parallel(cls, file_path, format="csv", workers=None, chunk_size=1000):
+        # Параллельный разбор файла (форматы как в iter_from_file).
+        # Возвращает список кортежей (номер_строки, объект, ошибка) в порядке строк файла.
+        parser_name = _batch_parser_name(format)
+        if parser_name is None:
+            raise ValueError(f"Неизвестный формат файла: {format}")
+        if chunk_size < 1:
+            raise ValueError("chunk_size должен быть положительным числом")
+        try:
+            f = open(file_path, 'r', encoding='utf-8')
+        except FileNotFoundError:
+            raise ValueError(f"Файл {file_path} не найден")
+        # Файл читается по мере обработки: в работе не больше двух кусков на процесс,
+        # новый кусок отправляется после получения результата самого старого.
+        # Результат (список всех записей) все равно целиком собирается в памяти.
+        window = 2 * (workers or os.cpu_count() or 1)
+        results = []
+        with f, ProcessPoolExecutor(max_workers=workers) as executor:
+            in_flight = deque()
+            lines, numbers = [], []
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                numbers.append(line_no)
+                lines.append(line)
+                if len(lines) == chunk_size:
+                    if len(in_flight) == window:
+                        _collect_chunk(results, *in_flight.popleft())
+                    in_flight.append((numbers, executor.submit(_parse_chunk, cls, parser_name, lines)))
+                    lines, numbers = [], []
+            if lines:
+                in_flight.append((numbers, executor.submit(_parse_chunk, cls, parser_name, lines)))
+            while in_flight:
+                _collect_chunk(results, *in_flight.popleft())
+        return results
+
+    @classmethod
+    def export_to_file(cls, clients, file_path, format="jsonl", chunk_size=10000):
+        # Потоковая выгрузка в файл в тех же форматах, что читает iter_from_file:
+        # "jsonl" - to_json() по строке на клиента, "csv" - to_string().
+        # Строки пишутся пачками по chunk_size; clients может быть генератором.
+        # Запись идет во временный файл рядом с file_path, который заменяет file_path
+        # только после успешной выгрузки всех клиентов: при ошибке в записи
+        # существующий файл остается прежним. Возвращает количество записанных клиентов.
+        if format == "jsonl":
+            serialize = cls.to_json
+        elif format == "csv":
+            serialize = cls.to_string
+        else:
+            raise ValueError(f"Неизвестный формат файла: {format}")
+        if chunk_size < 1:
+            raise ValueError("chunk_size должен быть положительным числом")
+        count = 0
+        tmp_path = f"{file_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                buffer = []
+                for client in clients:
+                    buffer.append(serialize(client))
+                    if len(buffer) == chunk_size:
+                        f.write("\n".join(buffer) + "\n")
+                        count += len(buffer)
+                        buffer = []
+                if buffer:
+                    f.write("\n".join(buffer) + "\n")
+                    count += len(buffer)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        return count
+
+    def to_dict(self):
+        return {
+            "client_id": self._client_id,
+            "last_name": self._last_name,
+            "initials": self._initials,
+            "phone": self._phone,
+        }
+
+    def to_json(self):
+        # Формат, который принимают from_json и конструктор
+        return _dumps(self.to_dict())
+
+    def to_string(self):
+        # Формат, который принимают from_string и конструктор (поля через ';')
+        values = self.to_dict().values()
+        for value in values:
+            if ";" in value or "\n" in value:
+                raise ValueError("Поле содержит ';' или перевод строки и не может быть записано строкой")
+        return ";".join(values)
+
     def __str__(self):
         return f"ClientShort(client_id={self._client_id}, last_name={self._last_name}, initials={self._initials}, phone={self._phone})"
 
@@ -112,11 +407,85 @@ class ClientShort:
                 self._initials == other._initials and
                 self._phone == other._phone)
 
-    # Перегрузка для сравнения по client_id (меньше)
+    # Хеш согласован с __eq__ (по тем же полям), поэтому клиентов можно класть в set/dict.
+    # Хеш меняется при изменении полей: не изменяйте клиента, пока он лежит в set/dict.
+    def __hash__(self):
+        return hash((self._client_id, self._last_name, self._initials, self._phone))
+
+    # Перегрузка для сравнения по client_id (меньше), в естественном порядке: "99" < "101".
+    # Для id из одних цифр сравниваются числа; иначе natural_key строится при каждом
+    # сравнении, поэтому большие списки лучше сортировать с ключом:
+    # sorted(clients, key=lambda c: ClientShort.natural_key(c.client_id))
     def __lt__(self, other):
         if not isinstance(other, ClientShort):
             return NotImplemented
-        return self._client_id < other._client_id
+        a, b = self._client_id, other._client_id
+        if a.isdecimal() and b.isdecimal():
+            return int(a) < int(b)
+        return self.natural_key(a) < self.natural_key(b)
+
+    # Подписка на изменения полей через сеттеры (используется индексами ClientRepository).
+    # Слушатель реализует метод client_changed(client, field, old, new) и, если он может
+    # отклонить изменение, метод client_changing(client, field, old, new), выбрасывающий ValueError.
+    def add_listener(self, listener):
+        if listener not in self._listeners:
+            self._listeners = self._listeners + (listener,)
+
+    def remove_listener(self, listener):
+        self._listeners = tuple(l for l in self._listeners if l is not listener)
+
+    def _notify(self, field, old, new):
+        # Вызывается до присваивания. Сначала все слушатели проверяют изменение
+        # (client_changing), и только если никто не отклонил его - применяют (client_changed),
+        # поэтому отказ одного слушателя не оставляет другие в измененном состоянии.
+        listeners = self._listeners
+        for listener in listeners:
+            check = getattr(listener, "client_changing", None)
+            if check is not None:
+                check(self, field, old, new)
+        for listener in listeners:
+            listener.client_changed(self, field, old, new)
+        # Поле отмечается измененным, только если слушатели приняли изменение;
+        # возврат к исходному значению снимает отметку
+        if old != new:
+            dirty = self._dirty
+            if dirty is None:
+                self._dirty = {field: old}
+            elif field not in dirty:
+                dirty[field] = old
+            elif dirty[field] == new:
+                del dirty[field]
+
+    # Отслеживание изменений через сеттеры (для выгрузки только измененных записей)
+    def dirty_fields(self):
+        return tuple(self._dirty) if self._dirty else ()
+
+    def changes(self):
+        # Поле -> (значение до изменений, текущее значение)
+        if not self._dirty:
+            return {}
+        return {field: (old, getattr(self, "_" + field)) for field, old in self._dirty.items()}
+
+    def mark_clean(self):
+        self._dirty = None
+
+    # copy.copy/deepcopy и pickle: копия получает только поля клиента, без слушателей
+    # и отметок изменений (иначе индексы репозитория следили бы за копией)
+    def __getstate__(self):
+        state = {}
+        for name in _state_slots(type(self)):
+            try:
+                # Без __getattr__: незаполненные слоты LazyClient не разбираются
+                state[name] = object.__getattribute__(self, name)
+            except AttributeError:
+                pass
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+        self._listeners = ()
+        self._dirty = None
 
     @property
     def client_id(self):
@@ -125,6 +494,7 @@ class ClientShort:
     @client_id.setter
     def client_id(self, value):
         self.validate_client_id(value)
+        self._notify("client_id", self._client_id, value)
         self._client_id = value
 
     @property
@@ -134,6 +504,7 @@ class ClientShort:
     @last_name.setter
     def last_name(self, value):
         self.validate_name(value)
+        self._notify("last_name", self._last_name, value)
         self._last_name = value
 
     @property
@@ -143,6 +514,7 @@ class ClientShort:
     @initials.setter
     def initials(self, value):
         self.validate_initials(value)
+        self._notify("initials", self._initials, value)
         self._initials = value
 
     @property
@@ -152,37 +524,31 @@ class ClientShort:
     @phone.setter
     def phone(self, value):
         self.validate_phone(value)
+        self._notify("phone", self._phone, value)
         self._phone = value
 
 
 class Client(ClientShort):
-    def __init__(self, *args):
+    __slots__ = ("_first_name", "_middle_name", "_address")
+
+    _FIELDS = ("client_id", "last_name", "first_name", "middle_name", "address", "phone")
+
+    @staticmethod
+    def validate_address(value):
+        if not isinstance(value, str) or not value.strip():
+            raise ValueError("Адрес должен быть непустой строкой")
+
+    @staticmethod
+    def make_initials(first_name, middle_name):
+        return f"{first_name[0] if first_name else ''}.{middle_name[0] if middle_name else ''}."
+
+    def __init__(self, *args, format=None):
         if len(args) == 1:
             arg = args[0]
             if isinstance(arg, str):
-                # Попытка парсинга как JSON
-                try:
-                    data = json.loads(arg)
-                    client_id = data.get("client_id", "")
-                    last_name = data.get("last_name", "")
-                    first_name = data.get("first_name", "")
-                    middle_name = data.get("middle_name", "")
-                    address = data.get("address", "")
-                    phone = data.get("phone", "")
-                    initials = f"{first_name[0] if first_name else ''}.{middle_name[0] if middle_name else ''}."
-                except json.JSONDecodeError:
-                    # Парсинг как строка: client_id;last_name;first_name;middle_name;address;phone
-                    parts = arg.split(';')
-                    if len(parts) != 6:
-                        raise ValueError("Неверный формат строки или JSON")
-                    client_id = parts[0].strip()
-                    last_name = parts[1].strip()
-                    first_name = parts[2].strip()
-                    middle_name = parts[3].strip()
-                    address = parts[4].strip()
-                    phone = parts[5].strip()
-                    initials = f"{first_name[0] if first_name else ''}.{middle_name[0] if middle_name else ''}."
-            elif isinstance(arg, dict):
+                # Строка: JSON или client_id;last_name;first_name;middle_name;address;phone
+                arg = self._parse_str(arg, format)
+            if isinstance(arg, dict):
                 # Прямая передача dict (JSON-like)
                 client_id = arg.get("client_id", "")
                 last_name = arg.get("last_name", "")
@@ -190,68 +556,40 @@ class Client(ClientShort):
                 middle_name = arg.get("middle_name", "")
                 address = arg.get("address", "")
                 phone = arg.get("phone", "")
-                initials = f"{first_name[0] if first_name else ''}.{middle_name[0] if middle_name else ''}."
             else:
                 raise ValueError("Неверный тип аргумента для перегрузки")
         elif len(args) == 6:
             client_id, last_name, first_name, middle_name, address, phone = args
-            initials = f"{first_name[0] if first_name else ''}.{middle_name[0] if middle_name else ''}."
         else:
             raise ValueError("Неверное количество аргументов для Client")
+        initials = self.make_initials(first_name, middle_name)
 
         # Валидация и инициализация дополнительных полей
         self.validate_name(first_name)
         self.validate_name(middle_name)
-        if not isinstance(address, str) or not address.strip():
-            raise ValueError("Адрес должен быть непустой строкой")
+        self.validate_address(address)
         super().__init__(client_id, last_name, initials, phone)
         self._first_name = first_name
         self._middle_name = middle_name
         self._address = address
 
-    @classmethod
-    def from_string(cls, s):
-        # Парсинг строки в формате: client_id;last_name;first_name;middle_name;address;phone
-        parts = s.split(';')
-        if len(parts) != 6:
-            raise ValueError("Неверный формат строки")
-        client_id = parts[0].strip()
-        last_name = parts[1].strip()
-        first_name = parts[2].strip()
-        middle_name = parts[3].strip()
-        address = parts[4].strip()
-        phone = parts[5].strip()
-        return cls(client_id, last_name, first_name, middle_name, address, phone)
-
-    @classmethod
-    def from_json(cls, json_str):
-        data = json.loads(json_str)
-        client_id = data.get("client_id", "")
-        last_name = data.get("last_name", "")
-        first_name = data.get("first_name", "")
-        middle_name = data.get("middle_name", "")
-        address = data.get("address", "")
-        phone = data.get("phone", "")
-        return cls(client_id, last_name, first_name, middle_name, address, phone)
-
-    @classmethod
-    def from_json_file(cls, file_path):
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                json_str = f.read()
-            return cls.from_json(json_str)
-        except FileNotFoundError:
-            raise ValueError(f"Файл {file_path} не найден")
-        except json.JSONDecodeError:
-            raise ValueError(f"Неверный JSON в файле {file_path}")
+    def to_dict(self):
+        return {
+            "client_id": self._client_id,
+            "last_name": self._last_name,
+            "first_name": self._first_name,
+            "middle_name": self._middle_name,
+            "address": self._address,
+            "phone": self._phone,
+        }
 
     def __str__(self):
         return (f"Client(client_id={self._client_id}, last_name={self._last_name}, first_name={self._first_name}, "
                 f"middle_name={self._middle_name}, address={self._address}, phone={self._phone})")
 
     def short_str(self):
-        initials = f"{self._first_name[0] if self._first_name else ''}.{self._middle_name[0] if self._middle_name else ''}."
-        return f"{self._last_name} {initials}"
+        # Инициалы уже хранятся в _initials и обновляются сеттерами first_name/middle_name
+        return f"{self._last_name} {self._initials}"
 
     def __eq__(self, other):
         if not isinstance(other, Client):
@@ -261,6 +599,10 @@ class Client(ClientShort):
                 self._middle_name == other._middle_name and
                 self._address == other._address)
 
+    def __hash__(self):
+        return hash((self._client_id, self._last_name, self._initials, self._phone,
+                     self._first_name, self._middle_name, self._address))
+
     # Перегрузка для сложения (объединение имен)
     def __add__(self, other):
         if not isinstance(other, Client):
@@ -279,9 +621,10 @@ class Client(ClientShort):
     @first_name.setter
     def first_name(self, value):
         self.validate_name(value)
+        self._notify("first_name", self._first_name, value)
         self._first_name = value
         # Обновляем initials при изменении first_name
-        self._initials = f"{self._first_name[0] if self._first_name else ''}.{self._middle_name[0] if self._middle_name else ''}."
+        self._initials = self.make_initials(self._first_name, self._middle_name)
 
     @property
     def middle_name(self):
@@ -290,9 +633,10 @@ class Client(ClientShort):
     @middle_name.setter
     def middle_name(self, value):
         self.validate_name(value)
+        self._notify("middle_name", self._middle_name, value)
         self._middle_name = value
         # Обновляем initials при изменении middle_name
-        self._initials = f"{self._first_name[0] if self._first_name else ''}.{self._middle_name[0] if self._middle_name else ''}."
+        self._initials = self.make_initials(self._first_name, self._middle_name)
 
     @property
     def address(self):
@@ -300,11 +644,147 @@ class Client(ClientShort):
 
     @address.setter
     def address(self, value):
-        if not isinstance(value, str) or not value.strip():
-            raise ValueError("Адрес должен быть непустой строкой")
+        self.validate_address(value)
+        self._notify("address", self._address, value)
         self._address = value
 
 
+def _lazy_property(slot, field, base):
+    # Свойство LazyClient: при первом чтении поле берется из разобранной строки и
+    # валидируется, дальше читается из слота как у Client. Сеттер остается от Client.
+    def fget(self):
+        pending = self._pending
+        if pending is None or field in pending:
+            return self._load_slot(slot)
+        return base.fget(self)
+    return property(fget, base.fset)
+
+
+class LazyClient(Client):
+    # Client с отложенным разбором: хранит исходную строку (JSON или через ';') и
+    # разбирает ее при первом обращении к любому полю, а валидирует каждое поле
+    # только при первом обращении к нему (client_id, phone, ...).
+    # Ошибка в поле проявляется как ValueError при обращении к нему;
+    # validate() проверяет все поля сразу.
+    __slots__ = ("_raw", "_format", "_pending")
+
+    # Слот -> (поле исходной записи, имя валидатора)
+    _LAZY_SLOTS = {
+        "_client_id": ("client_id", "validate_client_id"),
+        "_last_name": ("last_name", "validate_name"),
+        "_first_name": ("first_name", "validate_name"),
+        "_middle_name": ("middle_name", "validate_name"),
+        "_address": ("address", "validate_address"),
+        "_phone": ("phone", "validate_phone"),
+    }
+
+    def __init__(self, raw, format=None):
+        if not isinstance(raw, str):
+            raise ValueError("LazyClient принимает строку (JSON или через ';')")
+        self._raw = raw
+        self._format = format
+        # None - строка еще не разобрана; иначе поле -> значение для еще не проверенных полей
+        self._pending = None
+        self._listeners = ()
+        self._dirty = None
+
+    def _parse_raw(self):
+        # Строка через ';' только делится на части: strip выполняется для читаемых полей
+        raw = self._raw
+        format = self._format = self._format or self._sniff_format(raw)
+        if format == "csv":
+            parts = raw.split(';')
+            if len(parts) != len(self._FIELDS):
+                raise ValueError("Неверный формат строки или JSON")
+            values = dict(zip(self._FIELDS, parts))
+        else:
+            # Поля, которых нет в JSON, считаются пустыми (как в конструкторе Client)
+            values = self._parse_str(raw, format)
+            for field in self._FIELDS:
+                if field not in values:
+                    values[field] = ""
+        self._raw = None
+        return values
+
+    def _load_slot(self, slot):
+        field, validator = self._LAZY_SLOTS[slot]
+        pending = self._pending
+        if pending is None:
+            pending = self._pending = self._parse_raw()
+        value = pending[field]
+        if self._format == "csv":
+            value = value.strip()
+        getattr(self, validator)(value)
+        setattr(self, slot, value)
+        del pending[field]
+        return value
+
+    def __getattr__(self, name):
+        # Вызывается для еще не заполненных слотов, когда методы Client читают их напрямую
+        if name == "_initials":
+            value = self.make_initials(self._first_name, self._middle_name)
+            self._initials = value
+            return value
+        if name in self._LAZY_SLOTS:
+            return self._load_slot(name)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def validate(self):
+        # Полная проверка всех полей сразу
+        for name in (*self._LAZY_SLOTS, "_initials"):
+            getattr(self, name)
+        return self
+
+    client_id = _lazy_property("_client_id", "client_id", Client.client_id)
+    last_name = _lazy_property("_last_name", "last_name", Client.last_name)
+    first_name = _lazy_property("_first_name", "first_name", Client.first_name)
+    middle_name = _lazy_property("_middle_name", "middle_name", Client.middle_name)
+    address = _lazy_property("_address", "address", Client.address)
+    phone = _lazy_property("_phone", "phone", Client.phone)
+
+
+def _cached_property(base):
+    # Свойство CachedClient: сеттер Client, после присваивания сбрасывающий готовые строки
+    def fset(self, value):
+        base.fset(self, value)
+        self._str_cache = None
+        self._short_str_cache = None
+    return property(base.fget, fset)
+
+
+class CachedClient(Client):
+    # Client, запоминающий __str__ и short_str до изменения любого поля через сеттер.
+    # Для повторного вывода одних и тех же клиентов (списки в интерфейсе, отчеты);
+    # каждая выведенная запись хранит свои строки, поэтому для разовой выгрузки
+    # больших наборов лучше обычный Client.
+    __slots__ = ("_str_cache", "_short_str_cache")
+
+    def __init__(self, *args, format=None):
+        super().__init__(*args, format=format)
+        self._str_cache = None
+        self._short_str_cache = None
+
+    def __str__(self):
+        s = self._str_cache
+        if s is None:
+            s = self._str_cache = super().__str__()
+        return s
+
+    def short_str(self):
+        s = self._short_str_cache
+        if s is None:
+            s = self._short_str_cache = super().short_str()
+        return s
+
+    client_id = _cached_property(Client.client_id)
+    last_name = _cached_property(Client.last_name)
+    initials = _cached_property(Client.initials)
+    phone = _cached_property(Client.phone)
+    first_name = _cached_property(Client.first_name)
+    middle_name = _cached_property(Client.middle_name)
+    address = _cached_property(Client.address)
+
+
 # Код для ввода и вывода (не трогает классы выше)
 if __name__ == "__main__":
     print("Добро пожаловать в демонстрацию классов клиентов (с перегрузкой конструкторов)!")
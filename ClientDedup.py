@@ -0,0 +1,179 @@
+# Поиск дубликатов клиентов за почти линейное время.
+# 1. Точные дубликаты находятся через __hash__/__eq__ за один проход.
+# 2. Остальные клиенты раскладываются по блокам: нормализованный телефон и
+#    (фамилия, инициалы). Нечеткое сравнение имени и адреса выполняется только
+#    внутри блока, а не для всех пар.
+from collections import Counter
+from difflib import SequenceMatcher
+
+from Client import Client, ClientShort
+
+# Веса составляющих оценки сходства: без совпадения телефона дубликатом считаются
+# только записи с почти одинаковыми именем и адресом
+NAME_WEIGHT = 0.6
+ADDRESS_WEIGHT = 0.3
+PHONE_WEIGHT = 0.1
+
+
+def _profile(client):
+    # Нормализованные поля для сравнения: полное имя, адрес (None у ClientShort),
+    # 10 цифр телефона и частоты символов имени и адреса для быстрой верхней оценки
+    if isinstance(client, Client):
+        name = f"{client.last_name} {client.first_name} {client.middle_name}".casefold()
+        address = client.address.casefold()
+    else:
+        name = f"{client.last_name} {client.initials}".casefold()
+        address = None
+    phone = ClientShort.normalize_phone(client.phone)[-10:]
+    return name, Counter(name), address, Counter(address or ""), phone
+
+
+def blocking_keys(client):
+    # Ключи блоков: последние 10 цифр телефона (без кода страны) и (фамилия, инициалы)
+    keys = []
+    phone = ClientShort.normalize_phone(client.phone)
+    if phone:
+        keys.append(("phone", phone[-10:]))
+    keys.append(("name", client.last_name.strip().casefold(), client.initials.strip().casefold()))
+    return keys
+
+
+def _upper_bound(a, b, counts_a, counts_b):
+    # Верхняя оценка SequenceMatcher.ratio() по совпадающим символам (как quick_ratio)
+    if a == b:
+        return 1.0
+    return 2.0 * sum((counts_a & counts_b).values()) / (len(a) + len(b))
+
+
+def _ratio(a, b):
+    return 1.0 if a == b else SequenceMatcher(None, a, b).ratio()
+
+
+def _score(profile_a, profile_b, threshold=None):
+    # Оценка сходства от 0 до 1: имя, адрес (если он есть у обоих) и совпадение телефона.
+    # С threshold сначала считается дешевая верхняя оценка, и если порог недостижим,
+    # возвращается 0.0 без полного сравнения строк.
+    name_a, name_counts_a, address_a, address_counts_a, phone_a = profile_a
+    name_b, name_counts_b, address_b, address_counts_b, phone_b = profile_b
+    phone = PHONE_WEIGHT if phone_a and phone_a == phone_b else 0.0
+    has_address = address_a is not None and address_b is not None
+    if threshold is not None:
+        name_bound = _upper_bound(name_a, name_b, name_counts_a, name_counts_b)
+        address_bound = name_bound
+        if has_address:
+            address_bound = _upper_bound(address_a, address_b, address_counts_a, address_counts_b)
+        if phone + NAME_WEIGHT * name_bound + ADDRESS_WEIGHT * address_bound < threshold:
+            return 0.0
+    name = _ratio(name_a, name_b)
+    if not has_address:
+        return phone + (NAME_WEIGHT + ADDRESS_WEIGHT) * name
+    if threshold is not None and phone + NAME_WEIGHT * name + ADDRESS_WEIGHT * address_bound < threshold:
+        return 0.0
+    return phone + NAME_WEIGHT * name + ADDRESS_WEIGHT * _ratio(address_a, address_b)
+
+
+def similarity(a, b):
+    return _score(_profile(a), _profile(b))
+
+
+class _UnionFind:
+    __slots__ = ("_parent",)
+
+    def __init__(self, n):
+        self._parent = list(range(n))
+
+    def find(self, i):
+        parent = self._parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(self, i, j):
+        i, j = self.find(i), self.find(j)
+        if i != j:
+            self._parent[max(i, j)] = min(i, j)
+
+
+def _candidate_pairs(bucket, profiles, max_bucket, window):
+    # Все пары внутри небольшого блока; в большом блоке (например, частая фамилия) -
+    # только соседи в окне после сортировки по полному имени
+    if len(bucket) <= max_bucket:
+        for x in range(len(bucket)):
+            for y in range(x + 1, len(bucket)):
+                yield bucket[x], bucket[y]
+    else:
+        bucket = sorted(bucket, key=lambda i: profiles[i][0])
+        for x in range(len(bucket)):
+            for y in range(x + 1, min(x + 1 + window, len(bucket))):
+                yield bucket[x], bucket[y]
+
+
+def find_duplicates(clients, threshold=0.85, max_bucket=50, window=10):
+    # Возвращает группы дубликатов (списки из двух и более клиентов в исходном порядке)
+    clients = list(clients)
+    return [[clients[i] for i in group] for group in _duplicate_groups(clients, threshold, max_bucket, window)]
+
+
+def _duplicate_groups(clients, threshold, max_bucket, window):
+    # Группы дубликатов как списки позиций в clients (по возрастанию)
+    if not 0 < threshold <= 1:
+        raise ValueError("threshold должен быть в диапазоне (0, 1]")
+    groups = _UnionFind(len(clients))
+
+    first_seen = {}
+    unique = []
+    for i, client in enumerate(clients):
+        j = first_seen.setdefault(client, i)
+        if j == i:
+            unique.append(i)
+        else:
+            groups.union(j, i)
+
+    profiles = {i: _profile(clients[i]) for i in unique}
+    buckets = {}
+    for i in unique:
+        for key in blocking_keys(clients[i]):
+            buckets.setdefault(key, []).append(i)
+
+    compared = set()
+    for bucket in buckets.values():
+        if len(bucket) < 2:
+            continue
+        for i, j in _candidate_pairs(bucket, profiles, max_bucket, window):
+            if (i, j) in compared or groups.find(i) == groups.find(j):
+                continue
+            compared.add((i, j))
+            if _score(profiles[i], profiles[j], threshold) >= threshold:
+                groups.union(i, j)
+
+    members = {}
+    for i in range(len(clients)):
+        members.setdefault(groups.find(i), []).append(i)
+    return [group for group in members.values() if len(group) > 1]
+
+
+def dedupe(clients, merge=None, threshold=0.85, max_bucket=50, window=10):
+    # Список клиентов без дубликатов. merge(group) выбирает/строит запись для группы;
+    # по умолчанию остается первая запись. Для объединения через Client.__add__:
+    # dedupe(clients, merge=lambda group: functools.reduce(operator.add, group))
+    clients = list(clients)
+    if merge is None:
+        merge = _keep_first
+    # Замены по позициям (не по id объекта: один объект может встретиться в списке дважды);
+    # первая позиция группы получает результат merge, остальные удаляются
+    replaced = {}
+    for group in _duplicate_groups(clients, threshold, max_bucket, window):
+        replaced[group[0]] = merge([clients[i] for i in group])
+        for i in group[1:]:
+            replaced[i] = None
+    result = []
+    for i, client in enumerate(clients):
+        merged = replaced.get(i, client)
+        if merged is not None:
+            result.append(merged)
+    return result
+
+
+def _keep_first(group):
+    return group[0]
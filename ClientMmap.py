@@ -0,0 +1,143 @@
+import mmap
+import os
+import struct
+from array import array
+
+from Client import Client
+
+# Заголовок файла индекса: метка формата, размер и время изменения исходного файла
+_INDEX_MAGIC = b"CLIDX1\0\0"
+_INDEX_HEADER = struct.Struct("<8sQQ")
+
+# Размер куска файла при последовательном чтении полей
+_CHUNK_SIZE = 1 << 22
+
+
+class MmapClientReader:
+    # Чтение больших файлов со строками client_id;last_name;first_name;middle_name;address;phone
+    # (формат Client.from_string; для ClientShort - cls=ClientShort) через mmap.
+    # Границы записей ищутся по сырым байтам без декодирования всего файла;
+    # из строки декодируются только запрошенные поля. Смещения начал записей
+    # сохраняются рядом с файлом (<файл>.idx), что дает доступ к записи N за O(1)
+    # и позволяет не сканировать файл повторно, пока он не изменился.
+    def __init__(self, file_path, cls=Client, index_path=None):
+        self._cls = cls
+        self._file_path = file_path
+        self._index_path = index_path if index_path is not None else file_path + ".idx"
+        try:
+            self._file = open(file_path, 'rb')
+        except FileNotFoundError:
+            raise ValueError(f"Файл {file_path} не найден")
+        stat = os.fstat(self._file.fileno())
+        self._size = stat.st_size
+        self._mtime_ns = stat.st_mtime_ns
+        # mmap нельзя создать для пустого файла
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self._size else b""
+        self._offsets = self._load_index()
+        if self._offsets is None:
+            self._offsets = self._build_index()
+            self._save_index()
+
+    def _build_index(self):
+        mm = self._mm
+        offsets = array("Q")
+        pos = 0
+        while pos < self._size:
+            end = mm.find(b"\n", pos)
+            if end == -1:
+                end = self._size
+            if mm[pos:end].strip():
+                offsets.append(pos)
+            pos = end + 1
+        return offsets
+
+    def _load_index(self):
+        try:
+            with open(self._index_path, 'rb') as f:
+                header = f.read(_INDEX_HEADER.size)
+                if len(header) != _INDEX_HEADER.size:
+                    return None
+                magic, size, mtime_ns = _INDEX_HEADER.unpack(header)
+                if magic != _INDEX_MAGIC or size != self._size or mtime_ns != self._mtime_ns:
+                    return None
+                offsets = array("Q")
+                offsets.frombytes(f.read())
+                return offsets
+        except (OSError, ValueError):
+            return None
+
+    def _save_index(self):
+        # Индекс - только ускорение: если его не удалось записать, работаем без файла индекса
+        try:
+            with open(self._index_path, 'wb') as f:
+                f.write(_INDEX_HEADER.pack(_INDEX_MAGIC, self._size, self._mtime_ns))
+                f.write(self._offsets.tobytes())
+        except OSError:
+            pass
+
+    def _line(self, n):
+        start = self._offsets[n]
+        end = self._mm.find(b"\n", start)
+        if end == -1:
+            end = self._size
+        return self._mm[start:end]
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def record(self, n):
+        # Запись номер n (с нуля, пустые строки не считаются) как объект cls
+        if not -len(self._offsets) <= n < len(self._offsets):
+            raise ValueError(f"Нет записи с номером {n}")
+        return self._cls.from_string(self._line(n).decode('utf-8'))
+
+    def __getitem__(self, n):
+        return self.record(n)
+
+    def __iter__(self):
+        for n in range(len(self._offsets)):
+            yield self.record(n)
+
+    def iter_fields(self, fields=("client_id", "phone")):
+        # Кортежи только с запрошенными полями (без создания и валидации объектов)
+        # в порядке записей. Записи те же, что у record(): пустые строки пропускаются,
+        # строка с другим числом полей - ошибка.
+        columns = self._cls._FIELDS
+        for name in fields:
+            if name not in columns:
+                raise ValueError(f"Неизвестное поле: {name}")
+        positions = [columns.index(name) for name in fields]
+        width = len(columns)
+        mm = self._mm
+        size = self._size
+        n = 0
+        pos = 0
+        # Файл обрабатывается кусками по _CHUNK_SIZE байт, выровненными по концу строки:
+        # разбиение куска на строки и поля выполняется целиком на уровне bytes
+        while pos < size:
+            end = size if pos + _CHUNK_SIZE >= size else mm.rfind(b"\n", pos, pos + _CHUNK_SIZE)
+            if end < pos:
+                # Строка длиннее куска: берем ее целиком
+                end = mm.find(b"\n", pos + _CHUNK_SIZE)
+                if end == -1:
+                    end = size
+            for line in mm[pos:end].split(b"\n"):
+                if not line.strip():
+                    continue
+                parts = line.split(b";")
+                if len(parts) != width:
+                    raise ValueError(f"Неверный формат строки в записи {n}")
+                yield tuple([parts[i].strip().decode('utf-8') for i in positions])
+                n += 1
+            pos = end + 1
+
+    def close(self):
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,209 @@
+from bisect import bisect_left, bisect_right, insort
+
+from Client import ClientShort, _dumps
+
+# Записи журнала изменений: (client_id, поле); вместо поля - признак
+# добавления (выгружается вся запись) или удаления клиента
+_ADDED = None
+_DELETED = "-"
+
+
+class _SortedIndex:
+    # Отсортированный список пар (ключ, client_id): поиск по префиксу и диапазону за O(log n)
+    __slots__ = ("_entries",)
+
+    def __init__(self):
+        self._entries = []
+
+    def add(self, key, client_id):
+        insort(self._entries, (key, client_id))
+
+    def extend(self, pairs):
+        # Пакетное добавление: одна сортировка вместо вставки каждой пары
+        self._entries.extend(pairs)
+        self._entries.sort()
+
+    def remove(self, key, client_id):
+        i = bisect_left(self._entries, (key, client_id))
+        if i < len(self._entries) and self._entries[i] == (key, client_id):
+            del self._entries[i]
+
+    def prefix(self, prefix):
+        i = bisect_left(self._entries, (prefix,))
+        while i < len(self._entries) and self._entries[i][0].startswith(prefix):
+            yield self._entries[i][1]
+            i += 1
+
+    def range(self, low, high):
+        # Ключи в границах low <= key <= high
+        i = bisect_left(self._entries, (low,))
+        j = bisect_right(self._entries, (high, chr(0x10FFFF)))
+        for k in range(i, j):
+            yield self._entries[k][1]
+
+
+class ClientRepository:
+    # Коллекция клиентов с индексами:
+    # - хеш-индекс по client_id (поиск за O(1));
+    # - отсортированные индексы по фамилии и нормализованному телефону
+    #   (поиск по префиксу и диапазону).
+    # Репозиторий подписывается на изменения клиентов, поэтому индексы
+    # остаются согласованными при изменении client_id, last_name и phone через сеттеры.
+    # Все добавления, удаления и изменения полей пишутся в журнал с порядковыми номерами:
+    # checkpoint() - текущий номер, changes_since(checkpoint) - JSON-дельты после него.
+    def __init__(self, clients=()):
+        self._by_id = {}
+        self._by_last_name = _SortedIndex()
+        self._by_phone = _SortedIndex()
+        # Номер записи журнала = _log_start + индекс в _log
+        self._log = []
+        self._log_start = 0
+        self.add_many(clients)
+
+    def add_many(self, clients):
+        # Пакетное добавление: индексы сортируются один раз, а не вставкой каждого клиента.
+        # Все клиенты проверяются до изменения репозитория
+        clients = list(clients)
+        ids = set()
+        for client in clients:
+            if not isinstance(client, ClientShort):
+                raise ValueError("Репозиторий хранит только объекты ClientShort/Client")
+            if client.client_id in self._by_id or client.client_id in ids:
+                raise ValueError(f"Клиент с client_id={client.client_id} уже есть в репозитории")
+            ids.add(client.client_id)
+        for client in clients:
+            self._by_id[client.client_id] = client
+            client.add_listener(self)
+            self._log.append((client.client_id, _ADDED))
+        self._by_last_name.extend((c.last_name, c.client_id) for c in clients)
+        self._by_phone.extend((ClientShort.normalize_phone(c.phone), c.client_id) for c in clients)
+
+    def add(self, client):
+        if not isinstance(client, ClientShort):
+            raise ValueError("Репозиторий хранит только объекты ClientShort/Client")
+        if client.client_id in self._by_id:
+            raise ValueError(f"Клиент с client_id={client.client_id} уже есть в репозитории")
+        self._by_id[client.client_id] = client
+        self._by_last_name.add(client.last_name, client.client_id)
+        self._by_phone.add(ClientShort.normalize_phone(client.phone), client.client_id)
+        client.add_listener(self)
+        self._log.append((client.client_id, _ADDED))
+
+    def remove(self, client_id):
+        client = self._by_id.pop(client_id, None)
+        if client is None:
+            raise ValueError(f"Клиент с client_id={client_id} не найден")
+        self._by_last_name.remove(client.last_name, client_id)
+        self._by_phone.remove(ClientShort.normalize_phone(client.phone), client_id)
+        client.remove_listener(self)
+        self._log.append((client_id, _DELETED))
+        return client
+
+    def get(self, client_id, default=None):
+        return self._by_id.get(client_id, default)
+
+    def __getitem__(self, client_id):
+        try:
+            return self._by_id[client_id]
+        except KeyError:
+            raise ValueError(f"Клиент с client_id={client_id} не найден")
+
+    def __contains__(self, client_id):
+        return client_id in self._by_id
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def __iter__(self):
+        return iter(self._by_id.values())
+
+    def find_by_last_name_prefix(self, prefix):
+        return [self._by_id[cid] for cid in self._by_last_name.prefix(prefix)]
+
+    def find_by_last_name_range(self, low, high):
+        return [self._by_id[cid] for cid in self._by_last_name.range(low, high)]
+
+    def find_by_phone_prefix(self, prefix):
+        prefix = ClientShort.normalize_phone(prefix)
+        return [self._by_id[cid] for cid in self._by_phone.prefix(prefix)]
+
+    def find_by_phone_range(self, low, high):
+        low = ClientShort.normalize_phone(low)
+        high = ClientShort.normalize_phone(high)
+        return [self._by_id[cid] for cid in self._by_phone.range(low, high)]
+
+    def client_changing(self, client, field, old, new):
+        # Проверка до изменения: новый client_id не должен быть занят
+        if field == "client_id" and new != old and new in self._by_id:
+            raise ValueError(f"Клиент с client_id={new} уже есть в репозитории")
+
+    def client_changed(self, client, field, old, new):
+        # Вызывается сеттерами клиента до присваивания нового значения,
+        # после того как все слушатели приняли изменение в client_changing
+        if field == "client_id":
+            if new == old:
+                return
+            del self._by_id[old]
+            self._by_id[new] = client
+            self._by_last_name.remove(client.last_name, old)
+            self._by_last_name.add(client.last_name, new)
+            phone = ClientShort.normalize_phone(client.phone)
+            self._by_phone.remove(phone, old)
+            self._by_phone.add(phone, new)
+            # Для получателя дельт смена client_id - удаление старой записи и добавление новой
+            self._log.append((old, _DELETED))
+            self._log.append((new, _ADDED))
+            return
+        if field == "last_name":
+            self._by_last_name.remove(old, client.client_id)
+            self._by_last_name.add(new, client.client_id)
+        elif field == "phone":
+            self._by_phone.remove(ClientShort.normalize_phone(old), client.client_id)
+            self._by_phone.add(ClientShort.normalize_phone(new), client.client_id)
+        if new != old:
+            self._log.append((client.client_id, field))
+
+    def checkpoint(self):
+        # Номер, с которого changes_since вернет следующие изменения
+        return self._log_start + len(self._log)
+
+    def changes_since(self, checkpoint):
+        # Изменения после checkpoint, свернутые по клиентам: JSON-строки
+        # {"op": "upsert", "client_id": ..., "fields": {...}} с текущими значениями
+        # измененных полей (всех полей для добавленных) или {"op": "delete", "client_id": ...}.
+        # Возвращает (дельты, новый checkpoint).
+        if not self._log_start <= checkpoint <= self.checkpoint():
+            raise ValueError(f"Журнал изменений не содержит checkpoint {checkpoint}")
+        # client_id -> _ADDED, _DELETED или множество измененных полей
+        pending = {}
+        for client_id, field in self._log[checkpoint - self._log_start:]:
+            if field is _ADDED or field == _DELETED:
+                pending[client_id] = field
+                continue
+            state = pending.get(client_id)
+            if isinstance(state, set):
+                state.add(field)
+            elif client_id not in pending:
+                pending[client_id] = {field}
+
+        deltas = []
+        for client_id, state in pending.items():
+            client = self._by_id.get(client_id)
+            if client is None:
+                deltas.append(_dumps({"op": "delete", "client_id": client_id}))
+                continue
+            data = client.to_dict()
+            if isinstance(state, set):
+                # Поля, которых нет в to_dict (инициалы Client), вычисляются получателем
+                data = {field: data[field] for field in data if field in state}
+                if not data:
+                    continue
+            deltas.append(_dumps({"op": "upsert", "client_id": client_id, "fields": data}))
+        return deltas, self.checkpoint()
+
+    def truncate_log(self, checkpoint):
+        # Удаляет из журнала изменения до checkpoint (все получатели уже их забрали)
+        if not self._log_start <= checkpoint <= self.checkpoint():
+            raise ValueError(f"Журнал изменений не содержит checkpoint {checkpoint}")
+        del self._log[:checkpoint - self._log_start]
+        self._log_start = checkpoint
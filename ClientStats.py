@@ -0,0 +1,244 @@
+# Включаемая по требованию статистика горячих путей Client/ClientShort/LazyClient:
+# счетчики вызовов и ошибок, суммарное время и гистограммы времени (корзины по степеням
+# двойки в наносекундах) для перегрузок конструктора, валидаторов, разбора строк
+# и загрузки файлов.
+#
+#   import ClientStats
+#   ClientStats.enable()
+#   ... загрузка клиентов ...
+#   print(ClientStats.dump_json())
+#   ClientStats.disable()
+#
+# enable() подменяет методы классов обертками, disable() возвращает исходные методы,
+# поэтому без enable() накладных расходов нет. Время вложенных вызовов входит во время
+# внешних: например, from_json_file включает from_json, и разница между ними -
+# чтение файла. Статистика собирается только в текущем процессе (рабочие процессы
+# parse_batch/parse_file_parallel не учитываются); при работе из нескольких потоков
+# счетчики приблизительные.
+from time import perf_counter_ns
+
+from Client import Client, ClientShort, LazyClient, _dumps
+
+_CLASSES = (ClientShort, Client, LazyClient)
+
+_VALIDATORS = ("validate_client_id", "validate_name", "validate_initials",
+               "validate_phone", "validate_address")
+
+# Методы разбора и загрузки (classmethod); iter_from_file - генератор
+_PARSERS = ("_parse_row", "from_string", "from_json", "from_json_file",
+            "parse_batch", "parse_file_parallel", "export_to_file")
+
+# (класс, имя атрибута) -> исходный атрибут из __dict__ класса
+_originals = {}
+# Имя операции -> _Stat
+_stats = {}
+
+
+class _Stat:
+    __slots__ = ("count", "errors", "total_ns", "max_ns", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        # Номер корзины k - длительность меньше 2**k нс
+        self.buckets = {}
+
+    def add(self, ns):
+        self.count += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+        k = ns.bit_length()
+        self.buckets[k] = self.buckets.get(k, 0) + 1
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total_ns": self.total_ns,
+            "mean_ns": self.total_ns // self.count if self.count else 0,
+            "max_ns": self.max_ns,
+            "histogram": {f"<{1 << k}": n for k, n in sorted(self.buckets.items())},
+        }
+
+
+def _stat(name):
+    stat = _stats.get(name)
+    if stat is None:
+        stat = _stats[name] = _Stat()
+    return stat
+
+
+def _timed(name, func):
+    stat = _stat(name)
+
+    def wrapper(*args, **kwargs):
+        t0 = perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        except BaseException:
+            stat.errors += 1
+            raise
+        finally:
+            stat.add(perf_counter_ns() - t0)
+    return wrapper
+
+
+def _timed_classmethod(name, func):
+    # Имя операции строится по классу вызова: Client.from_string и ClientShort.from_string - разные строки
+    def wrapper(klass, *args, **kwargs):
+        stat = _stat(f"{klass.__name__}.{name}")
+        t0 = perf_counter_ns()
+        try:
+            return func(klass, *args, **kwargs)
+        except BaseException:
+            stat.errors += 1
+            raise
+        finally:
+            stat.add(perf_counter_ns() - t0)
+    return wrapper
+
+
+def _overload(args, kwargs):
+    # Перегрузка конструктора по аргументам: dict, json, csv или positional.
+    # format берется из kwargs или вторым позиционным аргументом (LazyClient(raw, format))
+    if not args and "raw" in kwargs:
+        args = (kwargs["raw"],)
+    if len(args) == 2 and isinstance(args[0], str) and args[1] in (None, "csv", "json"):
+        format = args[1]
+    elif len(args) == 1:
+        format = kwargs.get("format")
+    else:
+        return "positional"
+    arg = args[0]
+    if isinstance(arg, dict):
+        return "dict"
+    if isinstance(arg, str):
+        format = format or ClientShort._sniff_format(arg)
+        return "csv" if format == "csv" else "json"
+    return "other"
+
+
+def _timed_init(cls, func):
+    prefix = f"{cls.__name__}.__init__"
+
+    def wrapper(self, *args, **kwargs):
+        # Аргументы передаются как есть: обертка не должна менять поведение конструктора.
+        # Вызов через super().__init__ из подкласса не считается отдельной перегрузкой
+        if type(self).__init__ is not wrapper:
+            return func(self, *args, **kwargs)
+        stat = _stat(f"{prefix}[{_overload(args, kwargs)}]")
+        t0 = perf_counter_ns()
+        try:
+            return func(self, *args, **kwargs)
+        except BaseException:
+            stat.errors += 1
+            raise
+        finally:
+            stat.add(perf_counter_ns() - t0)
+    return wrapper
+
+
+def _timed_parse_str(func):
+    def wrapper(klass, s, format=None):
+        stat = _stat(f"{klass.__name__}._parse_str[{format or ClientShort._sniff_format(s)}]")
+        t0 = perf_counter_ns()
+        try:
+            return func(klass, s, format)
+        except BaseException:
+            stat.errors += 1
+            raise
+        finally:
+            stat.add(perf_counter_ns() - t0)
+    return wrapper
+
+
+def _timed_iter(func):
+    # Время генератора - от первого next() до исчерпания или закрытия;
+    # в "[records]" - число прочитанных записей и записей с ошибкой
+    def wrapper(klass, *args, **kwargs):
+        name = f"{klass.__name__}.iter_from_file"
+        stat = _stat(name)
+        records = _stat(name + "[records]")
+        t0 = perf_counter_ns()
+        failed = False
+        try:
+            for item in func(klass, *args, **kwargs):
+                records.count += 1
+                if item[2] is not None:
+                    records.errors += 1
+                yield item
+        except GeneratorExit:
+            # Вызывающий код прекратил чтение раньше конца файла - это не ошибка
+            raise
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            if failed:
+                stat.errors += 1
+            stat.add(perf_counter_ns() - t0)
+    return wrapper
+
+
+def _patch(cls, name, make):
+    attr = cls.__dict__[name]
+    _originals[(cls, name)] = attr
+    if isinstance(attr, staticmethod):
+        setattr(cls, name, staticmethod(make(attr.__func__)))
+    elif isinstance(attr, classmethod):
+        setattr(cls, name, classmethod(make(attr.__func__)))
+    else:
+        setattr(cls, name, make(attr))
+
+
+def is_enabled():
+    return bool(_originals)
+
+
+def enable():
+    if _originals:
+        return
+    for cls in _CLASSES:
+        # Обертываются только методы, определенные в самом классе
+        # (валидаторы - staticmethod, поэтому учитываются по классу, где определены)
+        own = cls.__dict__
+        if "__init__" in own:
+            _patch(cls, "__init__", lambda f, cls=cls: _timed_init(cls, f))
+        if "_parse_str" in own:
+            _patch(cls, "_parse_str", _timed_parse_str)
+        if "iter_from_file" in own:
+            _patch(cls, "iter_from_file", _timed_iter)
+        for name in _VALIDATORS:
+            if name in own:
+                _patch(cls, name, lambda f, name=name, cls=cls: _timed(f"{cls.__name__}.{name}", f))
+        for name in _PARSERS:
+            if name in own:
+                _patch(cls, name, lambda f, name=name: _timed_classmethod(name, f))
+
+
+def disable():
+    for (cls, name), attr in _originals.items():
+        setattr(cls, name, attr)
+    _originals.clear()
+
+
+def reset():
+    # Счетчики обнуляются на месте: включенные обертки продолжают писать в те же объекты
+    for stat in _stats.values():
+        stat.__init__()
+
+
+def stats():
+    # Имя операции -> dict со счетчиками и гистограммой (операции без вызовов пропускаются)
+    return {name: stat.to_dict() for name, stat in sorted(_stats.items()) if stat.count}
+
+
+def dump_json(file_path=None):
+    data = _dumps(stats())
+    if file_path is not None:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(data)
+    return data
@@ -0,0 +1,192 @@
+import sqlite3
+import threading
+from contextlib import contextmanager
+from queue import Empty, LifoQueue
+
+from Client import Client
+
+# Схема по "Description of the ER model"
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS Clients (
+    ClientID TEXT PRIMARY KEY,
+    LastName TEXT NOT NULL,
+    FirstName TEXT NOT NULL,
+    MiddleName TEXT NOT NULL,
+    Address TEXT NOT NULL,
+    Phone TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS Cars (
+    CarID TEXT PRIMARY KEY,
+    Brand TEXT NOT NULL,
+    Model TEXT NOT NULL,
+    PurchasePrice REAL NOT NULL,
+    RentalPricePerDay REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS RentalPoints (
+    PointID TEXT PRIMARY KEY,
+    Location TEXT NOT NULL,
+    ManagerName TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS Rentals (
+    RentalID TEXT PRIMARY KEY,
+    ClientID TEXT NOT NULL REFERENCES Clients(ClientID),
+    CarID TEXT NOT NULL REFERENCES Cars(CarID),
+    IssueDate TEXT NOT NULL,
+    ExpectedReturnDate TEXT NOT NULL,
+    ActualReturnDate TEXT
+);
+"""
+
+# Тексты запросов постоянны, поэтому sqlite3 переиспользует подготовленные выражения из кэша соединения
+_UPSERT_CLIENT = """
+INSERT INTO Clients (ClientID, LastName, FirstName, MiddleName, Address, Phone)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT(ClientID) DO UPDATE SET
+    LastName = excluded.LastName,
+    FirstName = excluded.FirstName,
+    MiddleName = excluded.MiddleName,
+    Address = excluded.Address,
+    Phone = excluded.Phone
+"""
+_SELECT_CLIENT = ("SELECT ClientID, LastName, FirstName, MiddleName, Address, Phone "
+                  "FROM Clients WHERE ClientID = ?")
+# Постраничная выборка по первичному ключу: соединение занято только на время одной страницы
+_SELECT_CLIENTS_PAGE = ("SELECT ClientID, LastName, FirstName, MiddleName, Address, Phone "
+                        "FROM Clients WHERE ClientID > ? ORDER BY ClientID LIMIT ?")
+_SELECT_CLIENTS_FIRST_PAGE = ("SELECT ClientID, LastName, FirstName, MiddleName, Address, Phone "
+                              "FROM Clients ORDER BY ClientID LIMIT ?")
+_DELETE_CLIENT = "DELETE FROM Clients WHERE ClientID = ?"
+_COUNT_CLIENTS = "SELECT COUNT(*) FROM Clients"
+
+
+class ClientStorage:
+    # Хранение клиентов в SQLite (таблица Clients модели ER).
+    # - WAL-журнал: чтение не блокируется записью;
+    # - пул соединений для многопоточного использования (поток, уже взявший
+    #   соединение, при вложенном вызове получает его же и не ждет пул);
+    # - пакетная запись через executemany в одной транзакции.
+    # Для базы ":memory:" пул состоит из одного соединения (у каждого соединения своя память).
+    def __init__(self, db_path, pool_size=4, cached_statements=128):
+        if pool_size < 1:
+            raise ValueError("pool_size должен быть положительным числом")
+        self._db_path = db_path
+        self._cached_statements = cached_statements
+        self._pool_size = 1 if db_path == ":memory:" else pool_size
+        self._pool = LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._closed = False
+        with self.connection() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self):
+        conn = sqlite3.connect(self._db_path, check_same_thread=False,
+                               cached_statements=self._cached_statements)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    @contextmanager
+    def connection(self):
+        # Берет соединение из пула (или создает новое, пока пул не заполнен) и возвращает его обратно
+        if self._closed:
+            raise ValueError("Хранилище закрыто")
+        held = getattr(self._local, "conn", None)
+        if held is not None:
+            yield held
+            return
+        conn = self._acquire()
+        self._local.conn = conn
+        try:
+            yield conn
+        finally:
+            self._local.conn = None
+            self._release(conn)
+
+    def _acquire(self):
+        try:
+            return self._pool.get_nowait()
+        except Empty:
+            pass
+        with self._lock:
+            create = self._created < self._pool_size
+            if create:
+                self._created += 1
+        if create:
+            return self._connect()
+        # Ожидание соединения, освобожденного другим потоком; после close() ждать нечего
+        while True:
+            try:
+                return self._pool.get(timeout=0.1)
+            except Empty:
+                if self._closed:
+                    raise ValueError("Хранилище закрыто")
+
+    def _release(self, conn):
+        # Соединение, возвращенное после close(), закрывается сразу
+        if self._closed:
+            conn.close()
+            return
+        self._pool.put(conn)
+        if self._closed:
+            self._close_idle()
+
+    def _close_idle(self):
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except Empty:
+                break
+
+    def upsert_clients(self, clients):
+        # Вставка или обновление набора клиентов одной транзакцией; clients может быть генератором
+        rows = ((c.client_id, c.last_name, c.first_name, c.middle_name, c.address, c.phone)
+                for c in clients)
+        with self.connection() as conn:
+            with conn:
+                cursor = conn.executemany(_UPSERT_CLIENT, rows)
+        return cursor.rowcount
+
+    def upsert_client(self, client):
+        return self.upsert_clients((client,))
+
+    def get_client(self, client_id):
+        with self.connection() as conn:
+            row = conn.execute(_SELECT_CLIENT, (client_id,)).fetchone()
+        return Client(*row) if row is not None else None
+
+    def iter_clients(self, batch_size=1000):
+        # Клиенты в порядке ClientID страницами по batch_size. Соединение возвращается
+        # в пул до выдачи клиентов страницы, поэтому внутри цикла можно обращаться
+        # к хранилищу, а недочитанный генератор не держит соединение
+        with self.connection() as conn:
+            rows = conn.execute(_SELECT_CLIENTS_FIRST_PAGE, (batch_size,)).fetchall()
+        while rows:
+            for row in rows:
+                yield Client(*row)
+            if len(rows) < batch_size:
+                break
+            with self.connection() as conn:
+                rows = conn.execute(_SELECT_CLIENTS_PAGE, (rows[-1][0], batch_size)).fetchall()
+
+    def delete_client(self, client_id):
+        with self.connection() as conn:
+            with conn:
+                return conn.execute(_DELETE_CLIENT, (client_id,)).rowcount > 0
+
+    def count_clients(self):
+        with self.connection() as conn:
+            return conn.execute(_COUNT_CLIENTS).fetchone()[0]
+
+    def close(self):
+        # Свободные соединения закрываются сразу, занятые - когда их вернут в пул
+        self._closed = True
+        self._close_idle()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
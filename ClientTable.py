@@ -0,0 +1,60 @@
+import sys
+
+from Client import Client
+
+
+class ClientTable:
+    # Колоночное хранение большого набора клиентов: по одному списку на поле.
+    # Повторяющиеся значения (фамилии, имена, отчества) интернируются,
+    # поэтому одинаковые строки хранятся в памяти один раз.
+    # Объекты Client создаются только по запросу (table[i], итерация).
+    _COLUMNS = ("client_id", "last_name", "first_name", "middle_name", "address", "phone")
+    _INTERNED = frozenset(("last_name", "first_name", "middle_name"))
+
+    __slots__ = ("_columns",)
+
+    def __init__(self, clients=()):
+        self._columns = {name: [] for name in self._COLUMNS}
+        self.extend(clients)
+
+    def append(self, client):
+        if not isinstance(client, Client):
+            raise ValueError("ClientTable хранит только объекты Client")
+        self.append_row(client.client_id, client.last_name, client.first_name,
+                        client.middle_name, client.address, client.phone)
+
+    def append_row(self, client_id, last_name, first_name, middle_name, address, phone):
+        # Добавление без создания объекта Client (валидация та же, что в конструкторе)
+        Client.validate_client_id(client_id)
+        Client.validate_name(last_name)
+        Client.validate_name(first_name)
+        Client.validate_name(middle_name)
+        Client.validate_address(address)
+        Client.validate_phone(phone)
+        values = (client_id, last_name, first_name, middle_name, address, phone)
+        for name, value in zip(self._COLUMNS, values):
+            if name in self._INTERNED:
+                value = sys.intern(value)
+            self._columns[name].append(value)
+
+    def extend(self, clients):
+        for client in clients:
+            self.append(client)
+
+    def column(self, name):
+        if name not in self._columns:
+            raise ValueError(f"Неизвестная колонка: {name}")
+        return tuple(self._columns[name])
+
+    def row(self, index):
+        return tuple(self._columns[name][index] for name in self._COLUMNS)
+
+    def __len__(self):
+        return len(self._columns["client_id"])
+
+    def __getitem__(self, index):
+        return Client(*self.row(index))
+
+    def __iter__(self):
+        for values in zip(*(self._columns[name] for name in self._COLUMNS)):
+            yield Client(*values)
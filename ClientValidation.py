@@ -0,0 +1,125 @@
+# Пакетная проверка записей клиентов по колонкам, без исключений на каждую запись.
+# Результат - отчет со списком ошибок (строка, поле, сообщение), по которому
+# можно отбросить или отложить плохие строки и создать объекты только из хороших.
+from collections import Counter
+
+from Client import Client, ClientShort
+
+# Допустимая длина телефона в цифрах после нормализации (с кодом страны или без)
+PHONE_MIN_DIGITS = 10
+PHONE_MAX_DIGITS = 15
+
+_MESSAGES = {
+    "client_id": "client_id должен быть непустой строкой",
+    "last_name": "Имя/Фамилия должны быть непустой строкой",
+    "first_name": "Имя/Фамилия должны быть непустой строкой",
+    "middle_name": "Имя/Фамилия должны быть непустой строкой",
+    "initials": "Инициалы должны быть непустой строкой",
+    "address": "Адрес должен быть непустой строкой",
+    "phone": "Телефон должен быть непустой строкой",
+}
+
+
+class ValidationReport:
+    def __init__(self, size, errors, normalized_phones):
+        self.size = size
+        # Список кортежей (номер строки, поле, сообщение), упорядоченный по строкам
+        self.errors = errors
+        # Телефоны, приведенные к цифрам (None для строк с неверным телефоном)
+        self.normalized_phones = normalized_phones
+        self.bad_rows = frozenset(row for row, _, _ in errors)
+
+    @property
+    def ok(self):
+        return not self.errors
+
+    def valid_rows(self):
+        return [i for i in range(self.size) if i not in self.bad_rows]
+
+    def split(self, records):
+        # Разделение записей на (хорошие, плохие) по номерам строк отчета
+        good, bad = [], []
+        for i, record in enumerate(records):
+            (bad if i in self.bad_rows else good).append(record)
+        return good, bad
+
+    def to_dict(self):
+        return {
+            "size": self.size,
+            "bad_rows": len(self.bad_rows),
+            "errors": [{"row": row, "field": field, "error": message}
+                       for row, field, message in self.errors],
+        }
+
+    def __str__(self):
+        return (f"ValidationReport(size={self.size}, bad_rows={len(self.bad_rows)}, "
+                f"errors={len(self.errors)})")
+
+
+def _columns_from_records(records, fields):
+    # Записи - dict (как из JSON) или кортежи/списки в порядке fields.
+    # Возвращает колонки и ошибки записей с неверным числом полей.
+    columns = {name: [] for name in fields}
+    errors = []
+    for i, record in enumerate(records):
+        if isinstance(record, dict):
+            values = [record.get(name, "") for name in fields]
+        elif isinstance(record, (tuple, list)) and len(record) == len(fields):
+            values = record
+        else:
+            errors.append((i, None, f"Запись должна быть dict или содержать {len(fields)} полей"))
+            values = [""] * len(fields)
+        for name, value in zip(fields, values):
+            columns[name].append(value)
+    return columns, errors
+
+
+def validate_columns(columns, normalize_phone=True, unique_ids=True):
+    # columns - dict: имя поля -> список значений одинаковой длины.
+    # Проверки: непустые строки во всех колонках, формат телефона (если normalize_phone)
+    # и уникальность client_id в пределах пакета (если unique_ids).
+    return _validate(columns, (), normalize_phone, unique_ids)
+
+
+def validate_records(records, cls=Client, normalize_phone=True, unique_ids=True):
+    # Проверка списка записей (dict или кортежей полей cls._FIELDS)
+    columns, row_errors = _columns_from_records(records, cls._FIELDS)
+    return _validate(columns, row_errors, normalize_phone, unique_ids)
+
+
+def _validate(columns, row_errors, normalize_phone, unique_ids):
+    # row_errors - ошибки целых записей; их строки не проверяются по полям
+    sizes = {len(values) for values in columns.values()}
+    if len(sizes) > 1:
+        raise ValueError("Колонки должны быть одинаковой длины")
+    size = sizes.pop() if sizes else 0
+    errors = list(row_errors)
+    skip = {i for i, _, _ in errors}
+
+    for name, values in columns.items():
+        message = _MESSAGES.get(name, f"{name} должен быть непустой строкой")
+        errors.extend((i, name, message) for i, v in enumerate(values)
+                      if (not isinstance(v, str) or not v.strip()) and i not in skip)
+
+    phones = None
+    if normalize_phone and "phone" in columns:
+        message = f"Телефон должен содержать от {PHONE_MIN_DIGITS} до {PHONE_MAX_DIGITS} цифр"
+        phones = []
+        for i, v in enumerate(columns["phone"]):
+            digits = ClientShort.normalize_phone(v) if isinstance(v, str) and v.strip() else None
+            if digits is not None and not PHONE_MIN_DIGITS <= len(digits) <= PHONE_MAX_DIGITS:
+                errors.append((i, "phone", message))
+                digits = None
+            phones.append(digits)
+
+    if unique_ids and "client_id" in columns:
+        ids = [v if isinstance(v, str) and v.strip() else None for v in columns["client_id"]]
+        counts = Counter(ids)
+        counts.pop(None, None)
+        duplicates = {v for v, n in counts.items() if n > 1}
+        if duplicates:
+            errors.extend((i, "client_id", f"client_id {v} повторяется в пакете")
+                          for i, v in enumerate(ids) if v in duplicates)
+
+    errors.sort(key=lambda e: e[0])
+    return ValidationReport(size, errors, phones)
@@ -0,0 +1,141 @@
+from datetime import date, datetime
+
+
+class Rental:
+    # Штраф за каждый день просрочки возврата (руб.)
+    FINE_PER_DAY = 1000.0
+
+    __slots__ = ("_rental_id", "_client_id", "_car_id", "_issue_date",
+                 "_expected_return_date", "_actual_return_date")
+
+    @staticmethod
+    def validate_id(value):
+        if not isinstance(value, str) or not value.strip():
+            raise ValueError("rental_id/client_id/car_id должны быть непустой строкой")
+
+    @staticmethod
+    def to_date(value):
+        # Дата как datetime.date или строка ISO (YYYY-MM-DD).
+        # datetime - подкласс date: время отбрасывается, иначе его нельзя сравнить с date
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        if isinstance(value, str):
+            try:
+                return date.fromisoformat(value.strip())
+            except ValueError:
+                pass
+        raise ValueError("Дата должна быть datetime.date или строкой YYYY-MM-DD")
+
+    def __init__(self, *args):
+        if len(args) == 1:
+            arg = args[0]
+            if isinstance(arg, dict):
+                rental_id = arg.get("rental_id", "")
+                client_id = arg.get("client_id", "")
+                car_id = arg.get("car_id", "")
+                issue_date = arg.get("issue_date")
+                expected_return_date = arg.get("expected_return_date")
+                actual_return_date = arg.get("actual_return_date")
+            else:
+                raise ValueError("Неверный тип аргумента для перегрузки")
+        elif len(args) in (5, 6):
+            rental_id, client_id, car_id, issue_date, expected_return_date = args[:5]
+            actual_return_date = args[5] if len(args) == 6 else None
+        else:
+            raise ValueError("Неверное количество аргументов для Rental")
+
+        self.validate_id(rental_id)
+        self.validate_id(client_id)
+        self.validate_id(car_id)
+        issue_date = self.to_date(issue_date)
+        expected_return_date = self.to_date(expected_return_date)
+        if expected_return_date < issue_date:
+            raise ValueError("Ожидаемая дата возврата раньше даты выдачи")
+        self._rental_id = rental_id
+        self._client_id = client_id
+        self._car_id = car_id
+        self._issue_date = issue_date
+        self._expected_return_date = expected_return_date
+        self._actual_return_date = None
+        self.actual_return_date = actual_return_date
+
+    def _end_date(self, today):
+        # Аренда считается до фактического возврата, а для незавершенной - до today
+        if self._actual_return_date is not None:
+            return self._actual_return_date
+        return today if today is not None else date.today()
+
+    def rental_days(self, today=None):
+        # Оплачиваемые дни: минимум один день, даже при возврате в день выдачи
+        return max(1, (self._end_date(today) - self._issue_date).days)
+
+    def overdue_days(self, today=None):
+        return max(0, (self._end_date(today) - self._expected_return_date).days)
+
+    def is_overdue(self, today=None):
+        return self.overdue_days(today) > 0
+
+    def calculate_fine(self, today=None):
+        return self.overdue_days(today) * self.FINE_PER_DAY
+
+    def calculate_cost(self, car, today=None):
+        if car.car_id != self._car_id:
+            raise ValueError("Автомобиль не соответствует аренде")
+        return car.calculate_rental_cost(self.rental_days(today))
+
+    def __str__(self):
+        return (f"Rental(rental_id={self._rental_id}, client_id={self._client_id}, car_id={self._car_id}, "
+                f"issue_date={self._issue_date}, expected_return_date={self._expected_return_date}, "
+                f"actual_return_date={self._actual_return_date})")
+
+    def __eq__(self, other):
+        if not isinstance(other, Rental):
+            return False
+        return (self._rental_id == other._rental_id and
+                self._client_id == other._client_id and
+                self._car_id == other._car_id and
+                self._issue_date == other._issue_date and
+                self._expected_return_date == other._expected_return_date and
+                self._actual_return_date == other._actual_return_date)
+
+    @property
+    def rental_id(self):
+        return self._rental_id
+
+    @property
+    def client_id(self):
+        return self._client_id
+
+    @property
+    def car_id(self):
+        return self._car_id
+
+    @property
+    def issue_date(self):
+        return self._issue_date
+
+    @property
+    def expected_return_date(self):
+        return self._expected_return_date
+
+    @expected_return_date.setter
+    def expected_return_date(self, value):
+        value = self.to_date(value)
+        if value < self._issue_date:
+            raise ValueError("Ожидаемая дата возврата раньше даты выдачи")
+        self._expected_return_date = value
+
+    @property
+    def actual_return_date(self):
+        return self._actual_return_date
+
+    @actual_return_date.setter
+    def actual_return_date(self, value):
+        # None - аренда еще не завершена
+        if value is not None:
+            value = self.to_date(value)
+            if value < self._issue_date:
+                raise ValueError("Фактическая дата возврата раньше даты выдачи")
+        self._actual_return_date = value
@@ -0,0 +1,68 @@
+# Пакетный расчет стоимости аренды, просрочки и штрафов для целой таблицы аренд.
+# С NumPy расчет векторизован по массивам дат; без NumPy выполняется тот же расчет
+# построчно (результат - списки вместо массивов).
+from datetime import date
+
+from Rental import Rental
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def compute_billing(issue_dates, expected_dates, actual_dates, prices_per_day,
+                    today=None, fine_per_day=Rental.FINE_PER_DAY):
+    # Формулы совпадают с Rental.rental_days/overdue_days/calculate_fine и Car.calculate_rental_cost.
+    # Даты - datetime.date или строки YYYY-MM-DD; в actual_dates None означает незавершенную аренду.
+    # Возвращает dict с ключами "days", "cost", "overdue", "fine".
+    today = Rental.to_date(today) if today is not None else date.today()
+    if np is None:
+        return _compute_billing_python(issue_dates, expected_dates, actual_dates, prices_per_day,
+                                       today, fine_per_day)
+    issue = np.asarray(issue_dates, dtype="datetime64[D]")
+    expected = np.asarray(expected_dates, dtype="datetime64[D]")
+    actual = np.asarray(actual_dates, dtype="datetime64[D]")
+    prices = np.asarray(prices_per_day, dtype=np.float64)
+    if not (issue.shape == expected.shape == actual.shape == prices.shape):
+        raise ValueError("Массивы дат и цен должны быть одинаковой длины")
+    end = np.where(np.isnat(actual), np.datetime64(today, "D"), actual)
+    days = np.maximum((end - issue).astype(np.int64), 1)
+    overdue_days = np.maximum((end - expected).astype(np.int64), 0)
+    return {
+        "days": days,
+        "cost": days * prices,
+        "overdue": overdue_days > 0,
+        "fine": overdue_days * float(fine_per_day),
+    }
+
+
+def _compute_billing_python(issue_dates, expected_dates, actual_dates, prices_per_day,
+                            today, fine_per_day):
+    columns = [list(issue_dates), list(expected_dates), list(actual_dates), list(prices_per_day)]
+    if len({len(c) for c in columns}) > 1:
+        raise ValueError("Массивы дат и цен должны быть одинаковой длины")
+    result = {"days": [], "cost": [], "overdue": [], "fine": []}
+    for issue, expected, actual, price in zip(*columns):
+        end = Rental.to_date(actual) if actual is not None else today
+        days = max(1, (end - Rental.to_date(issue)).days)
+        overdue_days = max(0, (end - Rental.to_date(expected)).days)
+        result["days"].append(days)
+        result["cost"].append(days * float(price))
+        result["overdue"].append(overdue_days > 0)
+        result["fine"].append(overdue_days * float(fine_per_day))
+    return result
+
+
+def bill_rentals(rentals, cars, today=None, fine_per_day=Rental.FINE_PER_DAY):
+    # Расчет для списка объектов Rental; cars - объекты Car, цена берется по car_id
+    prices = {car.car_id: car.rental_price_per_day for car in cars}
+    rentals = list(rentals)
+    missing = {r.car_id for r in rentals} - prices.keys()
+    if missing:
+        raise ValueError(f"Нет автомобилей с car_id: {', '.join(sorted(missing))}")
+    return compute_billing([r.issue_date for r in rentals],
+                           [r.expected_return_date for r in rentals],
+                           [r.actual_return_date for r in rentals],
+                           [prices[r.car_id] for r in rentals],
+                           today=today, fine_per_day=fine_per_day)
@@ -0,0 +1,70 @@
+class RentalPoint:
+    __slots__ = ("_point_id", "_location", "_manager_name")
+
+    @staticmethod
+    def validate_point_id(value):
+        if not isinstance(value, str) or not value.strip():
+            raise ValueError("point_id должен быть непустой строкой")
+
+    @staticmethod
+    def validate_text(value):
+        if not isinstance(value, str) or not value.strip():
+            raise ValueError("Адрес/Имя менеджера должны быть непустой строкой")
+
+    def __init__(self, *args):
+        if len(args) == 1:
+            arg = args[0]
+            if isinstance(arg, dict):
+                point_id = arg.get("point_id", "")
+                location = arg.get("location", "")
+                manager_name = arg.get("manager_name", "")
+            else:
+                raise ValueError("Неверный тип аргумента для перегрузки")
+        elif len(args) == 3:
+            point_id, location, manager_name = args
+        else:
+            raise ValueError("Неверное количество аргументов для RentalPoint")
+
+        self.validate_point_id(point_id)
+        self.validate_text(location)
+        self.validate_text(manager_name)
+        self._point_id = point_id
+        self._location = location
+        self._manager_name = manager_name
+
+    def __str__(self):
+        return f"RentalPoint(point_id={self._point_id}, location={self._location}, manager_name={self._manager_name})"
+
+    def __eq__(self, other):
+        if not isinstance(other, RentalPoint):
+            return False
+        return (self._point_id == other._point_id and
+                self._location == other._location and
+                self._manager_name == other._manager_name)
+
+    @property
+    def point_id(self):
+        return self._point_id
+
+    @point_id.setter
+    def point_id(self, value):
+        self.validate_point_id(value)
+        self._point_id = value
+
+    @property
+    def location(self):
+        return self._location
+
+    @location.setter
+    def location(self, value):
+        self.validate_text(value)
+        self._location = value
+
+    @property
+    def manager_name(self):
+        return self._manager_name
+
+    @manager_name.setter
+    def manager_name(self, value):
+        self.validate_text(value)
+        self._manager_name = value
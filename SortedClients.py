@@ -0,0 +1,112 @@
+from bisect import bisect_left, bisect_right
+
+from Client import ClientShort
+
+
+class SortedClients:
+    # Поддерживаемый в отсортированном виде набор клиентов (порядок как у ClientShort.__lt__:
+    # естественный порядок client_id). Поиск позиции - бинарный, поэтому постраничная
+    # выдача и выборка диапазона не требуют пересортировки всего списка.
+    # При изменении client_id через сеттер клиент переставляется на новое место.
+    def __init__(self, clients=()):
+        # Начальный набор сортируется один раз по ключу, без вставки каждого клиента
+        clients = list(clients)
+        for client in clients:
+            if not isinstance(client, ClientShort):
+                raise ValueError("SortedClients хранит только объекты ClientShort/Client")
+        pairs = sorted(((self._key(c.client_id), c) for c in clients), key=lambda p: p[0])
+        self._keys = [key for key, _ in pairs]
+        self._clients = [client for _, client in pairs]
+        for i in range(1, len(self._keys)):
+            if self._keys[i] == self._keys[i - 1]:
+                raise ValueError(f"Клиент с client_id={self._clients[i].client_id} уже добавлен")
+        for client in self._clients:
+            client.add_listener(self)
+
+    @staticmethod
+    def _key(client_id):
+        # client_id в конце ключа различает id с одинаковым числовым значением ("7" и "007")
+        return ClientShort.natural_key(client_id), client_id
+
+    def add(self, client):
+        if not isinstance(client, ClientShort):
+            raise ValueError("SortedClients хранит только объекты ClientShort/Client")
+        key = self._key(client.client_id)
+        i = bisect_left(self._keys, key)
+        if i < len(self._keys) and self._keys[i] == key:
+            raise ValueError(f"Клиент с client_id={client.client_id} уже добавлен")
+        self._keys.insert(i, key)
+        self._clients.insert(i, client)
+        client.add_listener(self)
+
+    def remove(self, client_id):
+        i = self._index(client_id)
+        del self._keys[i]
+        client = self._clients.pop(i)
+        client.remove_listener(self)
+        return client
+
+    def _index(self, client_id):
+        key = self._key(client_id)
+        i = bisect_left(self._keys, key)
+        if i == len(self._keys) or self._keys[i] != key:
+            raise ValueError(f"Клиент с client_id={client_id} не найден")
+        return i
+
+    def get(self, client_id, default=None):
+        try:
+            return self._clients[self._index(client_id)]
+        except ValueError:
+            return default
+
+    def __contains__(self, client_id):
+        return self.get(client_id) is not None
+
+    def __len__(self):
+        return len(self._clients)
+
+    def __iter__(self):
+        return iter(list(self._clients))
+
+    def __getitem__(self, index):
+        return self._clients[index]
+
+    def irange(self, low=None, high=None):
+        # Клиенты с low <= client_id <= high (в естественном порядке); None - без границы
+        i = 0 if low is None else bisect_left(self._keys, (ClientShort.natural_key(low),))
+        j = len(self._keys) if high is None else bisect_right(self._keys, (ClientShort.natural_key(high), chr(0x10FFFF)))
+        for k in range(i, j):
+            yield self._clients[k]
+
+    def page(self, after=None, limit=50):
+        # Постраничная выдача по курсору: after - client_id последнего клиента
+        # предыдущей страницы (None - первая страница).
+        # Возвращает (список клиентов, курсор следующей страницы или None).
+        if limit < 1:
+            raise ValueError("limit должен быть положительным числом")
+        i = 0 if after is None else bisect_right(self._keys, self._key(after))
+        clients = self._clients[i:i + limit]
+        next_cursor = clients[-1].client_id if clients and i + limit < len(self._clients) else None
+        return clients, next_cursor
+
+    def client_changing(self, client, field, old, new):
+        # Проверка до изменения: новый client_id не должен быть занят
+        if field != "client_id" or new == old:
+            return
+        new_key = self._key(new)
+        j = bisect_left(self._keys, new_key)
+        if j < len(self._keys) and self._keys[j] == new_key:
+            raise ValueError(f"Клиент с client_id={new} уже добавлен")
+
+    def client_changed(self, client, field, old, new):
+        # Вызывается сеттером client_id до присваивания нового значения,
+        # после того как все слушатели приняли изменение в client_changing
+        if field != "client_id" or new == old:
+            return
+        new_key = self._key(new)
+        i = self._index(old)
+        del self._keys[i]
+        del self._clients[i]
+        j = bisect_left(self._keys, new_key)
+        self._keys.insert(j, new_key)
+        self._clients.insert(j, client)
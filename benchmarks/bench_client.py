@@ -0,0 +1,181 @@
+# Бенчмарки горячих путей Client/ClientShort: перегрузки конструктора, from_string,
+# from_json, from_json_file, __str__, short_str (и с кэшем CachedClient), __eq__, __add__.
+# Для каждой операции: пропускная способность, перцентили задержки одного вызова
+# и пиковая память (tracemalloc, отдельным прогоном, чтобы не искажать время).
+#
+# Запуск:
+#   python benchmarks/bench_client.py --scale 1k
+#   python benchmarks/bench_client.py --scale 100k --json results.json
+#   python benchmarks/bench_client.py --scale 100k --compare results.json
+# Масштабы: 1k, 100k, 1m. Сеть и сторонние пакеты не нужны.
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from Client import CachedClient, Client, ClientShort  # noqa: E402
+from datagen import generate_dicts, generate_rows  # noqa: E402
+
+SCALES = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+
+# Файловые операции ограничены этим числом файлов, чтобы не создавать миллион файлов
+FILE_LIMIT = 2_000
+
+
+def build_cases(rows, dicts, tmp_dir):
+    # Имя операции -> (входные данные, вызываемая функция одного аргумента)
+    clients = [Client(*r) for r in rows]
+    # CachedClient запоминает строки: после первого прогона меряются повторные вызовы
+    cached = [CachedClient(*r) for r in rows]
+    shorts = [ClientShort(c.client_id, c.last_name, c.initials, c.phone) for c in clients]
+    csv_lines = [";".join(r) for r in rows]
+    json_lines = [json.dumps(d, ensure_ascii=False) for d in dicts]
+    pairs = list(zip(clients, clients[1:] + clients[:1]))
+
+    file_paths = []
+    for i, line in enumerate(json_lines[:FILE_LIMIT]):
+        path = os.path.join(tmp_dir, f"client_{i}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(line)
+        file_paths.append(path)
+
+    return {
+        "Client(6 аргументов)": (rows, lambda r: Client(*r)),
+        "Client(строка ';')": (csv_lines, Client),
+        "Client(JSON-строка)": (json_lines, Client),
+        "Client(dict)": (dicts, Client),
+        "Client.from_string": (csv_lines, Client.from_string),
+        "Client.from_json": (json_lines, Client.from_json),
+        "Client.from_json_file": (file_paths, Client.from_json_file),
+        "Client.__str__": (clients, Client.__str__),
+        "Client.short_str": (clients, Client.short_str),
+        "ClientShort.short_str": (shorts, ClientShort.short_str),
+        "CachedClient.__str__": (cached, CachedClient.__str__),
+        "CachedClient.short_str": (cached, CachedClient.short_str),
+        "Client.__eq__": (pairs, lambda p: p[0] == p[1]),
+        "Client.__add__": (pairs, lambda p: p[0] + p[1]),
+    }
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    k = min(len(sorted_values) - 1, int(round(q / 100 * (len(sorted_values) - 1))))
+    return sorted_values[k]
+
+
+def measure(inputs, fn):
+    # Время: весь прогон целиком (пропускная способность) и каждый вызов отдельно (перцентили)
+    gc.collect()
+    start = time.perf_counter()
+    for x in inputs:
+        fn(x)
+    total = time.perf_counter() - start
+
+    clock = time.perf_counter_ns
+    latencies = []
+    append = latencies.append
+    for x in inputs:
+        t0 = clock()
+        fn(x)
+        append(clock() - t0)
+    latencies.sort()
+
+    gc.collect()
+    tracemalloc.start()
+    results = [fn(x) for x in inputs]
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+
+    return {
+        "ops": len(inputs),
+        "ops_per_sec": len(inputs) / total if total else 0.0,
+        "p50_ns": percentile(latencies, 50),
+        "p90_ns": percentile(latencies, 90),
+        "p99_ns": percentile(latencies, 99),
+        "max_ns": latencies[-1] if latencies else 0,
+        "peak_mem_bytes": peak,
+    }
+
+
+def git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                             capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(scale, seed, only=None):
+    n = SCALES[scale]
+    rows = list(generate_rows(n, seed))
+    dicts = list(generate_dicts(n, seed))
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, (inputs, fn) in build_cases(rows, dicts, tmp_dir).items():
+            if only and only not in name:
+                continue
+            results[name] = measure(inputs, fn)
+    return {
+        "meta": {
+            "scale": scale,
+            "n": n,
+            "seed": seed,
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def print_report(report, baseline=None):
+    meta = report["meta"]
+    print(f"Масштаб {meta['scale']} ({meta['n']} клиентов), commit {meta['commit']}, Python {meta['python']}")
+    header = f"{'операция':24} {'оп/с':>12} {'p50 нс':>9} {'p90 нс':>9} {'p99 нс':>9} {'пик КиБ':>10}"
+    if baseline:
+        header += f" {'к базе':>8}"
+    print(header)
+    for name, r in report["results"].items():
+        line = (f"{name:24} {r['ops_per_sec']:12,.0f} {r['p50_ns']:9,} {r['p90_ns']:9,} "
+                f"{r['p99_ns']:9,} {r['peak_mem_bytes'] / 1024:10,.1f}")
+        base = baseline["results"].get(name) if baseline else None
+        if base and base["ops_per_sec"]:
+            line += f" {r['ops_per_sec'] / base['ops_per_sec']:7.2f}x"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарки Client/ClientShort")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="1k")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--only", help="запускать только операции, содержащие эту подстроку")
+    parser.add_argument("--json", dest="json_path", help="сохранить результаты в JSON-файл")
+    parser.add_argument("--compare", help="JSON-файл прошлого запуска для сравнения")
+    args = parser.parse_args()
+
+    report = run(args.scale, args.seed, args.only)
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# Сравнение расхода памяти на одного клиента:
+# объекты с __dict__ (как было до __slots__), Client со __slots__ и ClientTable.
+# Запуск: python benchmarks/bench_memory.py [количество_клиентов]
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Client import Client  # noqa: E402
+from ClientTable import ClientTable  # noqa: E402
+
+LAST_NAMES = ["Иванов", "Петров", "Сидоров", "Кузнецов", "Смирнов", "Попов"]
+FIRST_NAMES = ["Иван", "Петр", "Алексей", "Сергей", "Андрей"]
+MIDDLE_NAMES = ["Иванович", "Петрович", "Владимирович", "Сергеевич"]
+CITIES = ["Москва", "Санкт-Петербург", "Казань", "Тула"]
+
+
+class DictClient:
+    # Раскладка атрибутов Client до введения __slots__ (по __dict__ на экземпляр)
+    def __init__(self, client_id, last_name, first_name, middle_name, address, phone):
+        self._client_id = client_id
+        self._last_name = last_name
+        self._initials = f"{first_name[0]}.{middle_name[0]}."
+        self._phone = phone
+        self._first_name = first_name
+        self._middle_name = middle_name
+        self._address = address
+
+
+def make_rows(n):
+    # Строки собираются заново (как при чтении из файла), а не берутся из констант
+    for i in range(n):
+        yield (str(i),
+               LAST_NAMES[i % len(LAST_NAMES)].encode().decode(),
+               FIRST_NAMES[i % len(FIRST_NAMES)].encode().decode(),
+               MIDDLE_NAMES[i % len(MIDDLE_NAMES)].encode().decode(),
+               f"{CITIES[i % len(CITIES)]}, ул. Ленина, {i}",
+               f"+7-9{i % 100:02d}-{i % 1000:03d}-{i % 100:02d}-{i % 97:02d}")
+
+
+def measure(build, n):
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    data = build(make_rows(n))
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data
+    return (current - start) / n
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    cases = [
+        ("__dict__ (до)", lambda rows: [DictClient(*r) for r in rows]),
+        ("Client __slots__", lambda rows: [Client(*r) for r in rows]),
+        ("ClientTable", lambda rows: _fill_table(rows)),
+    ]
+    print(f"Клиентов: {n}")
+    for name, build in cases:
+        print(f"{name:20} {measure(build, n):8.1f} байт/клиент")
+
+
+def _fill_table(rows):
+    table = ClientTable()
+    for r in rows:
+        table.append_row(*r)
+    return table
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# Микробенчмарк конструктора Client: строк в секунду для перегрузок
+# "строка через ';'", "JSON-строка" и "dict".
+# "до" - прежний порядок разбора строки (сначала json.loads, при ошибке split(';')),
+# "после" - текущий конструктор с определением формата по первому символу.
+# Запуск: python benchmarks/bench_parsing.py [количество_строк]
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from Client import Client  # noqa: E402
+from datagen import generate_dicts  # noqa: E402
+
+
+def legacy_client(arg):
+    # Разбор так, как это делал конструктор до введения format= (поля извлекаются явно)
+    if isinstance(arg, str):
+        try:
+            data = json.loads(arg)
+            return Client(data.get("client_id", ""), data.get("last_name", ""),
+                          data.get("first_name", ""), data.get("middle_name", ""),
+                          data.get("address", ""), data.get("phone", ""))
+        except json.JSONDecodeError:
+            parts = arg.split(';')
+            if len(parts) != 6:
+                raise ValueError("Неверный формат строки или JSON")
+            return Client(parts[0].strip(), parts[1].strip(), parts[2].strip(),
+                          parts[3].strip(), parts[4].strip(), parts[5].strip())
+    return Client(arg.get("client_id", ""), arg.get("last_name", ""),
+                  arg.get("first_name", ""), arg.get("middle_name", ""),
+                  arg.get("address", ""), arg.get("phone", ""))
+
+
+def run(build, rows):
+    start = time.perf_counter()
+    for row in rows:
+        build(row)
+    return time.perf_counter() - start
+
+
+def compare(rows, repeat=5):
+    # Прогоны "до" и "после" чередуются, берется лучший из каждого:
+    # меньше шума от планировщика, частоты процессора и сборщика мусора
+    best_before = best_after = float("inf")
+    for _ in range(repeat):
+        best_before = min(best_before, run(legacy_client, rows))
+        best_after = min(best_after, run(Client, rows))
+    return len(rows) / best_before, len(rows) / best_after
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    dicts = list(generate_dicts(n))
+    inputs = {
+        "строка ';'": [";".join(d[name] for name in Client._FIELDS) for d in dicts],
+        "JSON": [json.dumps(d, ensure_ascii=False) for d in dicts],
+        "dict": dicts,
+    }
+    print(f"Строк: {n}")
+    print(f"{'перегрузка':12} {'до, стр/с':>14} {'после, стр/с':>14} {'ускорение':>10}")
+    for name, rows in inputs.items():
+        before, after = compare(rows)
+        print(f"{name:12} {before:14,.0f} {after:14,.0f} {after / before:9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+# Генератор синтетических клиентов для бенчмарков (формат полей как в Client.txt).
+# Данные детерминированы: одинаковый seed дает одинаковый набор на любом компьютере.
+import random
+
+LAST_NAMES = ["Иванов", "Петров", "Сидоров", "Кузнецов", "Смирнов", "Попов", "Васильев",
+              "Соколов", "Михайлов", "Новиков", "Федоров", "Морозов", "Волков", "Алексеев"]
+FIRST_NAMES = ["Иван", "Петр", "Алексей", "Сергей", "Андрей", "Дмитрий", "Михаил",
+               "Николай", "Владимир", "Павел", "Егор", "Артем"]
+MIDDLE_NAMES = ["Иванович", "Петрович", "Алексеевич", "Сергеевич", "Андреевич",
+                "Дмитриевич", "Владимирович", "Николаевич"]
+CITIES = ["Москва", "Санкт-Петербург", "Казань", "Новосибирск", "Екатеринбург", "Тула"]
+STREETS = ["ул. Ленина", "пр. Мира", "ул. Гагарина", "ул. Пушкина", "Невский пр.", "ул. Садовая"]
+
+
+def generate_rows(n, seed=42):
+    # Кортежи (client_id, last_name, first_name, middle_name, address, phone)
+    rng = random.Random(seed)
+    for i in range(n):
+        yield (str(i + 1),
+               rng.choice(LAST_NAMES),
+               rng.choice(FIRST_NAMES),
+               rng.choice(MIDDLE_NAMES),
+               f"{rng.choice(CITIES)}, {rng.choice(STREETS)}, {rng.randint(1, 200)}",
+               f"+7-9{rng.randint(0, 99):02d}-{rng.randint(0, 999):03d}-"
+               f"{rng.randint(0, 99):02d}-{rng.randint(0, 99):02d}")
+
+
+def generate_dicts(n, seed=42):
+    keys = ("client_id", "last_name", "first_name", "middle_name", "address", "phone")
+    for row in generate_rows(n, seed):
+        yield dict(zip(keys, row))